@@ -2,10 +2,11 @@
 """Macro to run a proactive optimization cycle and print a summary."""
 from __future__ import annotations
 
+import copy
+import functools
+import io
 import json
-from typing import Any, Dict, List
-from textwrap import dedent
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING
 
 from dataiku import macro_config, plugin_config  # type: ignore
 
@@ -18,29 +19,53 @@ from dataiku_cloud_optimizer import (
     SimpleLLM,
     SlackNotifier,
     EmailNotifier,
+    to_columns,
 )
 
+if TYPE_CHECKING:  # annotations are strings under __future__, so only type checkers need these
+    from typing import Any, Dict, List
 
-def _parse_yaml_config(raw: str | None) -> Dict[str, Any]:
+
+@functools.lru_cache(maxsize=4)
+def _load_yaml_config(raw: str) -> Dict[str, Any]:
+    # Memoized on the raw text: repeated runs with unchanged config parse once
     if not raw:
         return {}
     try:  # pragma: no cover
         import yaml  # type: ignore
 
-        return yaml.safe_load(raw) or {}
+        # libyaml's C loader when available, pure-Python SafeLoader otherwise
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        return yaml.load(raw, Loader=loader) or {}  # nosec B506 - safe loader
     except Exception:
         return {}
 
 
+def _parse_yaml_config(raw: str) -> Dict[str, Any]:
+    # The memoized dict is shared between runs; hand each caller its own copy
+    return copy.deepcopy(_load_yaml_config(raw))
+
+
+def _dumps_json(obj: Any) -> str:
+    try:  # pragma: no cover - optional faster encoder, imported only when rendering
+        import orjson  # type: ignore
+    except ImportError:  # pragma: no cover
+        return json.dumps(obj, separators=(",", ":"))
+    return orjson.dumps(obj).decode("utf-8")
+
+
 def _build_agent(pconf: Dict[str, Any]) -> CloudOptimizerAgent:
-    cfg = _parse_yaml_config(pconf.get("default_config_yaml"))
+    cfg = _parse_yaml_config(pconf.get("default_config_yaml") or "")
     providers_cfg: Dict[str, Any] = cfg.get("providers", {}) if isinstance(cfg, dict) else {}
     strategies_cfg: Dict[str, Any] = cfg.get("strategies", {}) if isinstance(cfg, dict) else {}
 
     agent = CloudOptimizerAgent()
-    agent.register_provider("aws", AWSProvider(providers_cfg.get("aws")))
-    agent.register_provider("azure", AzureProvider(providers_cfg.get("azure")))
-    agent.register_provider("gcp", GCPProvider(providers_cfg.get("gcp")))
+    # Authenticates AWS/Azure/GCP concurrently, registration order is preserved
+    agent.register_providers({
+        "aws": AWSProvider(providers_cfg.get("aws")),
+        "azure": AzureProvider(providers_cfg.get("azure")),
+        "gcp": GCPProvider(providers_cfg.get("gcp")),
+    })
     cost_cfg = strategies_cfg.get("cost") if isinstance(strategies_cfg, dict) else None
     agent.register_strategy("cost", CostOptimizationStrategy(cost_cfg))
     # Optional LLM (prefer DSS connection)
@@ -54,10 +79,10 @@ def _build_agent(pconf: Dict[str, Any]) -> CloudOptimizerAgent:
     if pconf.get("notifications_enabled", True):
         slack_url = pconf.get("slack_webhook_url") or None
         if slack_url:
-            agent.register_notifier("slack", SlackNotifier(slack_url))  # type: ignore[attr-defined]
+            agent.register_notifier("slack", SlackNotifier(slack_url))
         emails = pconf.get("email_recipients") or ""
         if emails.strip():
-            agent.register_notifier("email", EmailNotifier(emails))  # type: ignore[attr-defined]
+            agent.register_notifier("email", EmailNotifier(emails))
     return agent
 
 
@@ -83,12 +108,22 @@ def do(payload: Dict[str, Any]) -> Dict[str, Any]:  # Dataiku macro entrypoint s
                     if isinstance(r, dict):
                         results.append(r)
 
-    summary = {"strategies_executed": strategies, "recommendations_count": len(results)}
+    columns = to_columns(results)
+    total_savings = float(sum(columns["savings"]))
+    summary = {
+        "strategies_executed": strategies,
+        "recommendations_count": len(results),
+        "total_savings": total_savings,
+    }
+
+    # Encoded once and compact: shown in the HTML block (which wraps it) and reused verbatim
+    # as LLM context, so the prompt carries no indentation whitespace
+    results_json = _dumps_json(results)
 
     # LLM summary (optional)
     if getattr(agent, "llm", None):  # type: ignore[attr-defined]
         try:
-            context = {"results": results, "strategies": strategies}
+            context = '{"results":' + results_json + ',"strategies":' + _dumps_json(strategies) + "}"
             enhanced = agent.llm.summarize(  # type: ignore[attr-defined]
                 f"Found {len(results)} recommendations", context
             )
@@ -97,23 +132,21 @@ def do(payload: Dict[str, Any]) -> Dict[str, Any]:  # Dataiku macro entrypoint s
             pass
 
     # Notifications (optional)
-    if agent.notifiers:  # type: ignore[attr-defined]
+    if agent.notifiers:
         msg = summary.get("llm_summary") or f"Recommendations: {len(results)}"
-        for name, notifier in agent.notifiers.items():  # type: ignore[attr-defined]
-            try:
-                notifier.send(msg)
-            except Exception:
-                pass
-
-    # Macro return format: HTML + JSON sections (simple)
-    html_lines = [
-        "<h3>Cloud Optimizer Proactive Cycle</h3>",
-        f"<p>Strategies: {', '.join(strategies)}</p><p>Recommendations: {len(results)}</p>",
-        "<pre style='white-space:pre-wrap;'>" + json.dumps(results, indent=2) + "</pre>",
-    ]
+        agent.notify(msg)
+
+    # Macro return format: HTML + JSON sections (simple), written into one buffer
+    buf = io.StringIO()
+    buf.write("<h3>Cloud Optimizer Proactive Cycle</h3>\n")
+    buf.write(f"<p>Strategies: {', '.join(strategies)}</p><p>Recommendations: {len(results)}</p>")
+    buf.write(f"<p>Total potential savings: ${total_savings:,.2f}</p>\n")
+    buf.write("<pre style='white-space:pre-wrap;'>")
+    buf.write(results_json)
+    buf.write("</pre>")
 
     return {
-        "result": "\n".join(html_lines),
+        "result": buf.getvalue(),
         "data": summary,
     }
 
@@ -1,15 +1,35 @@
 """Embedded subset of Dataiku Cloud Optimizer for DSS plugin."""
-from .core import CloudOptimizerAgent, OptimizationResult
-from .providers.aws import AWSProvider
-from .providers.azure import AzureProvider
-from .providers.gcp import GCPProvider
-from .strategies.cost_optimization import CostOptimizationStrategy
-from .llm import SimpleLLM
-from .notify import SlackNotifier, EmailNotifier
+from __future__ import annotations
+import importlib
+from typing import Any
+
+from .core import CloudOptimizerAgent, OptimizationResult, to_columns
+
+# Imported on first attribute access so a recipe only pays for the providers,
+# LLM client and notifiers (httpx) it actually uses
+_LAZY = {
+    "AWSProvider": ".providers.aws",
+    "AzureProvider": ".providers.azure",
+    "GCPProvider": ".providers.gcp",
+    "CostOptimizationStrategy": ".strategies.cost_optimization",
+    "SimpleLLM": ".llm",
+    "SlackNotifier": ".notify",
+    "EmailNotifier": ".notify",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "CloudOptimizerAgent",
     "OptimizationResult",
+    "to_columns",
     "AWSProvider",
     "AzureProvider",
     "GCPProvider",
@@ -1,14 +1,30 @@
 """Embedded core agent (subset) for DSS plugin."""
 from __future__ import annotations
-from dataclasses import dataclass
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, replace
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .providers.base import CloudProvider
 from .strategies.base import OptimizationStrategy
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+@dataclass(frozen=True)
 class OptimizationResult:
+    # Explicit __slots__ (no field defaults) keeps instances dict-free on Python < 3.10
+    __slots__ = (
+        "provider",
+        "resource_type",
+        "current_cost",
+        "optimized_cost",
+        "savings",
+        "recommendations",
+        "confidence_score",
+        "timestamp",
+    )
+
     provider: str
     resource_type: str
     current_cost: float
@@ -18,27 +34,113 @@ class OptimizationResult:
     confidence_score: float
     timestamp: datetime
 
+    # Frozen + hand-written __slots__: copy/pickle would restore state via setattr and
+    # hit FrozenInstanceError, so state is a plain tuple of field values
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+RESULT_FIELDS = ("provider", "resource_type", "savings", "confidence_score", "recommendations")
+
+
+def to_columns(records: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """Pivot run_strategy records into parallel per-field lists for aggregation."""
+    columns: Dict[str, List[Any]] = {k: [] for k in RESULT_FIELDS}
+    for rec in records:
+        for k, col in columns.items():
+            col.append(rec.get(k))
+    return columns
+
+
 class CloudOptimizerAgent:
-    def __init__(self) -> None:
+    def __init__(self, max_workers: Optional[int] = None) -> None:
         self.providers: Dict[str, CloudProvider] = {}
+        # Providers that failed authentication at registration and are skipped
+        self.disabled_providers: List[str] = []
         self.strategies: Dict[str, OptimizationStrategy] = {}
+        # Upper bound on concurrent provider calls in run_strategy (None -> one per provider)
+        self.max_workers = max_workers
+        # Optional components wired by the macro/recipe
+        self.llm: Any = None
+        self.notifiers: Dict[str, Any] = {}
+        # Last result per (provider, strategy) instance pair, reused while a too-small cost is
+        # unchanged; keyed on the objects so a re-registered provider or strategy starts fresh
+        self._last_results: Dict[Tuple[CloudProvider, OptimizationStrategy], OptimizationResult] = {}
 
     def register_provider(self, name: str, provider: CloudProvider) -> None:
-        self.providers[name] = provider
+        # Authenticate once here; provider methods no longer re-check on every call
+        if self._authenticate(name, provider):
+            self.providers[name] = provider
+
+    def register_providers(self, providers: Dict[str, CloudProvider]) -> None:
+        """Authenticate several providers concurrently, then register them in the given order."""
+        if not providers:
+            return
+        with ThreadPoolExecutor(max_workers=len(providers)) as ex:
+            ok = list(ex.map(lambda item: self._authenticate(*item), providers.items()))
+        for (name, provider), authenticated in zip(providers.items(), ok):
+            if authenticated:
+                self.providers[name] = provider
+
+    def _authenticate(self, name: str, provider: CloudProvider) -> bool:
+        try:
+            authenticated = provider.authenticate()
+        except Exception:  # pragma: no cover - defensive
+            logger.exception("Authentication failed for %s", name)
+            authenticated = False
+        if not authenticated:
+            self.disabled_providers.append(name)
+        return bool(authenticated)
 
     def register_strategy(self, name: str, strategy: OptimizationStrategy) -> None:
         self.strategies[name] = strategy
 
-    def optimize(self, provider_name: str, strategy_name: str) -> OptimizationResult:
+    def register_notifier(self, name: str, notifier: Any) -> None:
+        self.notifiers[name] = notifier
+
+    def notify(self, message: str, **kwargs: Any) -> Dict[str, bool]:
+        # Notifiers block on HTTP/SMTP, so send to all of them concurrently
+        if not self.notifiers:
+            return {}
+        status: Dict[str, bool] = {name: False for name in self.notifiers}
+        with ThreadPoolExecutor(max_workers=len(self.notifiers)) as ex:
+            futures = {ex.submit(n.send, message, **kwargs): name for name, n in self.notifiers.items()}
+            for fut in as_completed(futures):
+                try:
+                    status[futures[fut]] = fut.result() is not False
+                except Exception:
+                    logger.exception("Notifier '%s' failed", futures[fut])
+        return status
+
+    def optimize(self, provider_name: str, strategy_name: str, now: Optional[datetime] = None) -> OptimizationResult:
         if provider_name not in self.providers:
             raise ValueError(f"Provider {provider_name} not registered")
         if strategy_name not in self.strategies:
             raise ValueError(f"Strategy {strategy_name} not registered")
         provider = self.providers[provider_name]
         strategy = self.strategies[strategy_name]
+        if now is None:
+            now = datetime.now()
+        # A cached total too small for any recommendation, and the same total the last result
+        # was computed from, cannot change the strategy's answer: restamp it instead of re-running
+        key = (provider, strategy)
+        previous = self._last_results.get(key)
+        known_cost = provider.peek_total_cost()
+        if (
+            previous is not None
+            and known_cost is not None
+            and known_cost == previous.current_cost
+            and known_cost < strategy.min_cost_for_any_recommendation()
+        ):
+            return replace(
+                previous, provider=provider_name, recommendations=list(previous.recommendations), timestamp=now
+            )
         cost_data = provider.get_cost_data()
         opt = strategy.optimize(cost_data)
-        return OptimizationResult(
+        result = OptimizationResult(
             provider=provider_name,
             resource_type=opt.get("resource_type", "unknown"),
             current_cost=opt.get("current_cost", 0.0),
@@ -46,21 +148,34 @@ class CloudOptimizerAgent:
             savings=opt.get("savings", 0.0),
             recommendations=opt.get("recommendations", []),
             confidence_score=opt.get("confidence_score", 0.0),
-            timestamp=datetime.now(),
+            timestamp=now,
         )
+        self._last_results[key] = result
+        return result
 
     def run_strategy(self, strategy_name: str) -> List[Dict[str, Any]]:
-        results: List[Dict[str, Any]] = []
-        for prov_name in self.providers.keys():
-            try:
-                res = self.optimize(prov_name, strategy_name)
-                results.append({
-                    "provider": res.provider,
-                    "resource_type": res.resource_type,
-                    "savings": res.savings,
-                    "confidence_score": res.confidence_score,
-                    "recommendations": res.recommendations,
-                })
-            except Exception as e:  # pragma: no cover
-                print(f"Error optimizing {prov_name}: {e}")
-        return results
+        # Provider calls are network-bound, so fan them out and collect as they finish.
+        names = list(self.providers.keys())
+        if not names:
+            return []
+        # One cycle timestamp shared by every result of this run
+        now = datetime.now()
+        by_provider: Dict[str, Dict[str, Any]] = {}
+        workers = self.max_workers or len(names)
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            futures = {ex.submit(self.optimize, p, strategy_name, now): p for p in names}
+            for fut in as_completed(futures):
+                prov_name = futures[fut]
+                try:
+                    res = fut.result()
+                    by_provider[prov_name] = {
+                        "provider": res.provider,
+                        "resource_type": res.resource_type,
+                        "savings": res.savings,
+                        "confidence_score": res.confidence_score,
+                        "recommendations": res.recommendations,
+                    }
+                except Exception:  # pragma: no cover
+                    logger.exception("Error optimizing %s", prov_name)
+        # Keep registration order regardless of completion order
+        return [by_provider[p] for p in names if p in by_provider]
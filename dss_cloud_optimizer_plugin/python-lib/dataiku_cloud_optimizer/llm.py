@@ -7,9 +7,44 @@ Supports either:
 Falls back to returning the base summary on any error.
 """
 from __future__ import annotations
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
+import hashlib
 import json
 import os
+import time
+
+SYSTEM_PREFIX = (
+    "You are a FinOps assistant. Using the JSON context provided by the user, produce a concise, executive "
+    "summary (<= 120 words) focusing on total savings and top opportunities."
+)
+
+# Batched calls carry several numbered contexts and must answer with a JSON array
+BATCH_SYSTEM_PREFIX = (
+    "You are a FinOps assistant. The user sends several numbered items, each with a JSON context and a "
+    "base summary. For each item write a concise, executive summary (<= 120 words) focusing on total "
+    "savings and top opportunities. Reply with only a JSON array of strings, one per item, in order."
+)
+
+
+# Max items per batched summarize call; the output budget is scaled by the batch size
+BATCH_SIZE = 8
+
+
+def _user_prompt(base_summary: str, ctx_json: str) -> str:
+    return "Context:\n" + ctx_json + "\nBase Summary:\n" + base_summary
+
+
+def _context_json(context: Union[str, Dict[str, Any]]) -> str:
+    # A pre-serialized JSON string is used verbatim; dicts are serialized once
+    # (compact, canonical) for both the cache key and the prompt
+    if isinstance(context, str):
+        return context
+    return json.dumps(context, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def _cache_key(base_summary: str, ctx_json: str) -> str:
+    return hashlib.blake2b((base_summary + ctx_json).encode("utf-8"), digest_size=16).hexdigest()
+
 
 class SimpleLLM:
     def __init__(self, api_key: Optional[str], model: str = "gpt-4o-mini", max_tokens: int = 512, llm_connection: Optional[str] = None) -> None:
@@ -19,6 +54,9 @@ class SimpleLLM:
         self.llm_connection = llm_connection
         self._client = None  # lazy (OpenAI) or DSS mesh handle
         self._mesh = None    # DSS LLM mesh client
+        # Content-addressed response cache: digest -> (monotonic_ts, summary)
+        self._resp_cache: Dict[str, Tuple[float, str]] = {}
+        self.cache_ttl = 3600
 
     def _ensure_mesh(self) -> None:
         if self.llm_connection and self._mesh is None:
@@ -37,45 +75,107 @@ class SimpleLLM:
             except Exception:
                 self._client = None
 
-    def summarize(self, base_summary: str, context: Dict[str, Any]) -> str:
+    def summarize(self, base_summary: str, context: Union[str, Dict[str, Any]]) -> str:
+        ctx_json = _context_json(context)
+        # Identical recommendation sets across cycles reuse the previous answer
+        key = _cache_key(base_summary, ctx_json)
+        hit = self._cached(key)
+        if hit is not None:
+            return hit
+        text = self._complete(_user_prompt(base_summary, ctx_json)) or base_summary
+        if text != base_summary:  # only cache real LLM answers, not fallbacks
+            self._resp_cache[key] = (time.monotonic(), text)
+        return text
+
+    def summarize_batch(self, items: List[Tuple[str, Union[str, Dict[str, Any]]]]) -> List[str]:
+        """Summarize several (base_summary, context) pairs, up to BATCH_SIZE per LLM call.
+
+        Answers come back in input order. A batch whose reply is not a JSON array of the
+        expected length is retried item by item.
+        """
+        prepared = [(base, _context_json(ctx)) for base, ctx in items]
+        keys = [_cache_key(base, ctx_json) for base, ctx_json in prepared]
+        out: List[Optional[str]] = [self._cached(k) for k in keys]
+        pending = [i for i, text in enumerate(out) if text is None]
+        for start in range(0, len(pending), BATCH_SIZE):
+            idx = pending[start:start + BATCH_SIZE]
+            answers = self._complete_batch([prepared[i] for i in idx]) if len(idx) > 1 else None
+            if answers is None:
+                answers = [self._complete(_user_prompt(*prepared[i])) or prepared[i][0] for i in idx]
+            now = time.monotonic()
+            for i, text in zip(idx, answers):
+                out[i] = text
+                if text != prepared[i][0]:
+                    self._resp_cache[keys[i]] = (now, text)
+        return [text or base for text, (base, _) in zip(out, prepared)]
+
+    def _cached(self, key: str) -> Optional[str]:
+        hit = self._resp_cache.get(key)
+        if hit is not None and time.monotonic() - hit[0] < self.cache_ttl:
+            return hit[1]
+        return None
+
+    def _complete_batch(self, prepared: List[Tuple[str, str]]) -> Optional[List[str]]:
+        # One numbered prompt for the whole batch; the shared system prefix is paid once
+        parts = [f"[{n}]\n" + _user_prompt(base, ctx_json) for n, (base, ctx_json) in enumerate(prepared, 1)]
+        prompt = "\n\n".join(parts) + (
+            f"\n\nSummarize each of the {len(prepared)} numbered items separately. "
+            f"Return only a JSON array of exactly {len(prepared)} strings, in the same order."
+        )
+        # Each answer gets the single-summary budget, so a full batch is not truncated
+        raw = self._complete(prompt, system=BATCH_SYSTEM_PREFIX, max_tokens=self.max_tokens * len(prepared))
+        if not raw:
+            return None
+        try:
+            answers = json.loads(raw[raw.find("["):raw.rfind("]") + 1])
+        except ValueError:
+            return None
+        if not isinstance(answers, list) or len(answers) != len(prepared):
+            return None
+        if not all(isinstance(a, str) and a for a in answers):
+            return None
+        return answers
+
+    def _complete(self, user_prompt: str, system: str = SYSTEM_PREFIX, max_tokens: Optional[int] = None) -> Optional[str]:
+        """Run one completion against the mesh or OpenAI; None when unavailable or failed."""
         # Prefer DSS LLM Mesh
         if self.llm_connection:
             self._ensure_mesh()
             if self._mesh is None:
-                return base_summary
+                return None
             try:  # pragma: no cover
-                prompt = (
-                    "You are a FinOps assistant. Using the JSON context below, produce a concise, executive "
-                    "summary (<= 120 words) focusing on total savings and top opportunities.\nContext:\n"
-                    + json.dumps(context) + "\nBase Summary:\n" + base_summary
-                )
-                result = self._mesh.run(prompt, purpose="GENERIC_COMPLETION")
+                if hasattr(self._mesh, "new_completion"):
+                    completion = self._mesh.new_completion()
+                    completion.with_message(system, role="system")
+                    completion.with_message(user_prompt, role="user")
+                    result = completion.execute()
+                else:
+                    result = self._mesh.run(system + "\n" + user_prompt, purpose="GENERIC_COMPLETION")
                 # result may be dict or object depending on DSS; try common fields
                 if isinstance(result, dict):
-                    return result.get("text") or result.get("answer") or base_summary
-                return getattr(result, "text", base_summary) or base_summary
+                    return result.get("text") or result.get("answer") or None
+                return getattr(result, "text", None) or None
             except Exception:
-                return base_summary
+                return None
 
         # Fallback to direct OpenAI key
         if not self.api_key:
-            return base_summary
+            return None
         self._ensure_client()
         if self._client is None:
-            return base_summary
+            return None
         try:  # pragma: no cover
-            prompt = (
-                "You are a FinOps assistant. Using the JSON context below, produce a concise, executive "
-                "summary (<= 120 words) focusing on total savings and top opportunities.\nContext:\n"
-                + json.dumps(context) + "\nBase Summary:\n" + base_summary
-            )
+            # Static system message first so the provider's prompt-prefix cache can reuse it
             resp = self._client.chat.completions.create(
                 model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=self.max_tokens,
+                messages=[
+                    {"role": "system", "content": system},
+                    {"role": "user", "content": user_prompt},
+                ],
+                max_tokens=max_tokens or self.max_tokens,
                 temperature=0.2,
             )
             choice = resp.choices[0]
-            return getattr(choice.message, "content", base_summary) or base_summary
+            return getattr(choice.message, "content", None) or None
         except Exception:
-            return base_summary
+            return None
@@ -1,9 +1,39 @@
 """Lightweight notifiers for DSS plugin."""
 from __future__ import annotations
 from typing import Any, Dict, Optional
+import atexit
 import json
 import urllib.request
 
+# Shared keep-alive client so repeated webhook posts reuse one TCP/TLS connection.
+# Prefer httpx (HTTP/2 multiplexing when h2 is installed), then requests, then urllib.
+_CLIENT: Any = None
+try:  # pragma: no cover - optional dependency
+    import httpx
+
+    try:
+        import h2  # type: ignore  # noqa: F401
+
+        _HTTP2 = True
+    except ImportError:
+        _HTTP2 = False
+    # A handful of idle connections is plenty for webhook traffic (usually one host)
+    _CLIENT = httpx.Client(
+        http2=_HTTP2,
+        timeout=5.0,
+        limits=httpx.Limits(max_connections=8, max_keepalive_connections=4, keepalive_expiry=60.0),
+    )
+    atexit.register(_CLIENT.close)
+except Exception:  # pragma: no cover
+    try:  # requests ships with the DSS runtime
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        _CLIENT = requests.Session()
+        _CLIENT.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+    except Exception:
+        _CLIENT = None
+
 class SlackNotifier:
     def __init__(self, webhook_url: str | None) -> None:
         self.webhook_url = webhook_url
@@ -12,6 +42,12 @@ class SlackNotifier:
         if not self.webhook_url:
             return False
         payload = {"text": message}
+        if _CLIENT is not None:
+            try:  # pragma: no cover - network
+                resp = _CLIENT.post(self.webhook_url, json=payload, timeout=5)
+                return 200 <= resp.status_code < 300
+            except Exception:
+                return False
         data = json.dumps(payload).encode("utf-8")
         req = urllib.request.Request(self.webhook_url, data=data, headers={"Content-Type": "application/json"})
         try:  # pragma: no cover - network
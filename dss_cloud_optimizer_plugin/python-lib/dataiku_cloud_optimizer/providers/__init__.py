@@ -1,6 +1,18 @@
 """Provider implementations (embedded stubs for DSS plugin)."""
-from .aws import AWSProvider
-from .azure import AzureProvider
-from .gcp import GCPProvider
+from __future__ import annotations
+import importlib
+from typing import Any
+
+# Lazy so importing .base (as core does) does not load every provider module
+_LAZY = {"AWSProvider": ".aws", "AzureProvider": ".azure", "GCPProvider": ".gcp"}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = ["AWSProvider", "AzureProvider", "GCPProvider"]
@@ -2,7 +2,7 @@
 from __future__ import annotations
 import logging
 from typing import Any, Dict, List, Optional
-from .base import CloudProvider
+from .base import CloudProvider, ttl_cache
 
 logger = logging.getLogger(__name__)
 
@@ -15,16 +15,15 @@ class AWSProvider(CloudProvider):
 
     def authenticate(self) -> bool:
         try:
-            logger.info(f"Authenticating with AWS profile={self.profile}")
+            logger.info("Authenticating with AWS profile=%s", self.profile)
             self._authenticated = True
             return True
         except Exception as e:  # pragma: no cover - defensive
-            logger.error(f"AWS auth failed: {e}")
+            logger.error("AWS auth failed: %s", e)
             return False
 
+    @ttl_cache()
     def get_cost_data(self, start_date: Optional[str] = None, end_date: Optional[str] = None, **kwargs) -> Dict[str, Any]:
-        if not self._authenticated:
-            self.authenticate()
         if not start_date or not end_date:
             start_date, end_date = self.get_default_date_range()
         return {
@@ -37,8 +36,6 @@ class AWSProvider(CloudProvider):
         }
 
     def get_resource_inventory(self) -> List[Dict[str, Any]]:
-        if not self._authenticated:
-            self.authenticate()
         return [
             {
                 "resource_id": "i-1234567890abcdef0",
@@ -52,8 +49,6 @@ class AWSProvider(CloudProvider):
         ]
 
     def get_recommendations(self) -> List[Dict[str, Any]]:
-        if not self._authenticated:
-            self.authenticate()
         return [
             {
                 "type": "rightsizing",
@@ -67,8 +62,6 @@ class AWSProvider(CloudProvider):
         ]
 
     def get_rightsizing_opportunities(self) -> List[Dict[str, Any]]:
-        if not self._authenticated:
-            self.authenticate()
         return [
             {
                 "instance_id": "i-1234567890abcdef0",
@@ -83,8 +76,6 @@ class AWSProvider(CloudProvider):
         ]
 
     def get_unused_resources(self) -> List[Dict[str, Any]]:
-        if not self._authenticated:
-            self.authenticate()
         return [
             {
                 "resource_id": "vol-0987654321fedcba0",
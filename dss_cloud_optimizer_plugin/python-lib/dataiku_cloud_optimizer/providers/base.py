@@ -1,12 +1,78 @@
 """Base provider abstraction (embedded)."""
 from __future__ import annotations
+import copy
+import functools
+import time
 from abc import ABC, abstractmethod
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+DEFAULT_CACHE_TTL = 3600.0
+
+
+def ttl_cache(seconds: float = DEFAULT_CACHE_TTL) -> Callable:
+    """Memoize a provider's get_cost_data per (account scope, date range) for a TTL.
+
+    The TTL can be overridden per provider with the ``cache_ttl_seconds`` config key;
+    a value <= 0 disables caching. Callers always receive a private copy of the data.
+    """
+
+    def decorator(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(self: "CloudProvider", start_date: Optional[str] = None, end_date: Optional[str] = None, **kwargs: Any) -> Dict[str, Any]:
+            ttl = float(self.config.get("cache_ttl_seconds", seconds))
+            if ttl <= 0 or kwargs:
+                return fn(self, start_date, end_date, **kwargs)
+            if not start_date or not end_date:
+                start_date, end_date = self.get_default_date_range()
+            key = (type(self).__name__, self._cache_scope(), start_date, end_date)
+            now = time.monotonic()
+            hit = self._cost_cache.get(key)
+            if hit is not None and now - hit[0] < ttl:
+                return copy.deepcopy(hit[1])
+            result = fn(self, start_date, end_date, **kwargs)
+            self._cost_cache[key] = (now, copy.deepcopy(result))
+            self._remember_total(now + ttl, result)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+@functools.lru_cache(maxsize=8)
+def _default_range(ordinal: int) -> Tuple[str, str]:
+    # Keyed on today's ordinal so the formatting runs once per calendar day
+    end_date = date.fromordinal(ordinal)
+    start_date = end_date - timedelta(days=30)
+    return start_date.isoformat(), end_date.isoformat()
+
 
 class CloudProvider(ABC):
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         self.config = config or {}
+        self._cost_cache: Dict[Tuple[Any, ...], Tuple[float, Dict[str, Any]]] = {}
+        self._last_total: Optional[Tuple[float, float]] = None
+
+    def _cache_scope(self) -> Optional[str]:
+        # Account identity so cached costs never bleed across regions/subscriptions/projects
+        return self.config.get("region") or self.config.get("subscription_id") or self.config.get("project_id")
+
+    def invalidate_cache(self) -> None:
+        self._cost_cache.clear()
+        self._last_total = None
+
+    def _remember_total(self, expires: float, cost_data: Dict[str, Any]) -> None:
+        # Only cached fetches are remembered, and only for as long as the cache entry lives
+        total = cost_data.get("total_cost") if isinstance(cost_data, dict) else None
+        if isinstance(total, (int, float)):
+            self._last_total = (expires, float(total))
+
+    def peek_total_cost(self) -> Optional[float]:
+        """Last cached total_cost while its cache entry is fresh, without calling the cloud API."""
+        if self._last_total is None or time.monotonic() >= self._last_total[0]:
+            return None
+        return self._last_total[1]
 
     @abstractmethod
     def authenticate(self) -> bool:  # pragma: no cover - interface
@@ -33,9 +99,7 @@ class CloudProvider(ABC):
         pass
 
     def get_default_date_range(self) -> Tuple[str, str]:
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=30)
-        return start_date.strftime("%Y-%m-%d"), end_date.strftime("%Y-%m-%d")
+        return _default_range(date.today().toordinal())
 
     def validate_date_range(self, start_date: str, end_date: str) -> bool:
         try:
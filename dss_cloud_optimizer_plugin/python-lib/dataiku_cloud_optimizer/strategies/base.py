@@ -15,5 +15,9 @@ class OptimizationStrategy(ABC):
     def calculate_confidence(self, data: Dict[str, Any]) -> float:  # pragma: no cover - interface
         pass
 
+    def min_cost_for_any_recommendation(self) -> float:
+        """Total cost strictly below which optimize() cannot recommend anything (0 = unknown)."""
+        return 0.0
+
     def get_strategy_name(self) -> str:
         return self.__class__.__name__
@@ -1,21 +1,27 @@
 """Embedded cost optimization strategy."""
 from __future__ import annotations
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from .base import OptimizationStrategy
 
 logger = logging.getLogger(__name__)
 
+# (type, description, applies above total_cost, savings factor, savings cap, confidence)
+_RULES: Tuple[Tuple[str, str, float, float, Optional[float], float], ...] = (
+    ("rightsizing", "Rightsize overprovisioned instances", 500.0, 0.15, None, 0.8),
+    ("unused_resources", "Remove unused storage volumes and snapshots", 200.0, 0.08, 150.0, 0.9),
+)
+
 class CostOptimizationStrategy(OptimizationStrategy):
     def __init__(self, config: Optional[Dict[str, Any]] = None) -> None:
         super().__init__(config)
         self.min_savings_threshold = self.config.get("min_savings_threshold", 10.0)
 
     def optimize(self, cost_data: Dict[str, Any]) -> Dict[str, Any]:
-        logger.info(f"Optimizing cost data for provider={cost_data.get('provider','unknown')}")
+        logger.info("Optimizing cost data for provider=%s", cost_data.get("provider", "unknown"))
         total_cost = cost_data.get("total_cost", 0.0)
         recs = self._generate_recommendations(cost_data)
-        total_savings = sum(r.get("savings", 0) for r in recs)
+        total_savings = sum(r["savings"] for r in recs)
         optimized_cost = max(0, total_cost - total_savings)
         confidence = self.calculate_confidence(cost_data)
         return {
@@ -28,31 +34,42 @@ class CostOptimizationStrategy(OptimizationStrategy):
             "detailed_recommendations": recs,
         }
 
+    def min_cost_for_any_recommendation(self) -> float:
+        # A rule fires only above its cost floor and once total_cost * factor reaches the
+        # threshold; rules whose cap sits below the threshold can never fire. Callers skip
+        # strictly below the result: at exactly threshold / factor the rule still fires.
+        threshold = self.min_savings_threshold
+        floors = [
+            max(min_cost, threshold / factor)
+            for _, _, min_cost, factor, cap, _ in _RULES
+            if cap is None or cap >= threshold
+        ]
+        return min(floors) if floors else float("inf")
+
     def _generate_recommendations(self, cost_data: Dict[str, Any]) -> List[Dict[str, Any]]:
-        recs: List[Dict[str, Any]] = []
         total_cost = cost_data.get("total_cost", 0.0)
-        if total_cost > 500:
-            recs.append({
-                "type": "rightsizing",
-                "description": "Rightsize overprovisioned instances",
-                "savings": total_cost * 0.15,
-                "confidence": 0.8,
-            })
-        if total_cost > 200:
-            recs.append({
-                "type": "unused_resources",
-                "description": "Remove unused storage volumes and snapshots",
-                "savings": min(total_cost * 0.08, 150),
-                "confidence": 0.9,
-            })
-        return [r for r in recs if r["savings"] >= self.min_savings_threshold]
+        threshold = self.min_savings_threshold
+        recs: List[Dict[str, Any]] = []
+        for rec_type, description, min_cost, factor, cap, confidence in _RULES:
+            if total_cost <= min_cost:
+                continue
+            savings = total_cost * factor if cap is None else min(total_cost * factor, cap)
+            if savings >= threshold:
+                recs.append({
+                    "type": rec_type,
+                    "description": description,
+                    "savings": savings,
+                    "confidence": confidence,
+                })
+        return recs
 
     def calculate_confidence(self, data: Dict[str, Any]) -> float:
-        factors = []
+        # Plain scalar accumulation; no per-call factor list
+        score = 0.0
         if data.get("total_cost", 0) > 0:
-            factors.append(0.4)
+            score += 0.4
         if data.get("resource_count", 0) > 0:
-            factors.append(0.3)
+            score += 0.3
         if data.get("services"):
-            factors.append(0.3)
-        return min(sum(factors), 1.0)
+            score += 0.3
+        return min(score, 1.0)
@@ -6,12 +6,38 @@ executes optimization, and writes recommendations to the output dataset.
 """
 from __future__ import annotations
 
+import copy
+import functools
+import hashlib
+import heapq
 import json
+import logging
+import operator
+import re
+from concurrent.futures import ThreadPoolExecutor
 from textwrap import dedent
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 from datetime import datetime, timezone
 import uuid
 
+import pandas as pd
+
+try:  # pragma: no cover - optional dependency, imported once per process
+    import yaml  # type: ignore
+except ImportError:  # pragma: no cover
+    yaml = None
+
+try:  # pragma: no cover - optional faster encoder for nested row fields
+    import orjson  # type: ignore
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+except ImportError:  # pragma: no cover
+
+    def _dumps(obj: Any) -> str:
+        # Same compact output as orjson, so the stored cells do not depend on what is installed
+        return json.dumps(obj, separators=(",", ":"))
+
 # Dataiku APIs
 from dataiku import Dataset  # type: ignore
 from dataiku.customrecipe import (  # type: ignore
@@ -20,40 +46,138 @@ from dataiku.customrecipe import (  # type: ignore
     get_output_names_for_role,
 )
 
-# Import agent pieces (assuming the package copied into python-lib)
-from dataiku_cloud_optimizer import (
-    CloudOptimizerAgent,
-    AWSProvider,
-    AzureProvider,
-    GCPProvider,
-    CostOptimizationStrategy,
-    SimpleLLM,
-    SlackNotifier,
-    EmailNotifier,
-)
+# Import agent pieces (assuming the package copied into python-lib); providers,
+# LLM and notifiers are imported in _build_agent only when configured
+from dataiku_cloud_optimizer import CloudOptimizerAgent, CostOptimizationStrategy
 
+logger = logging.getLogger(__name__)
 
-def _parse_yaml_config(raw: str | None) -> Dict[str, Any]:
-    if not raw:
-        return {}
-    try:  # pragma: no cover - optional dependency & edge parsing
-        import yaml  # type: ignore
+# Comma separator for the strategies param, swallowing surrounding whitespace
+_STRATEGY_SEP = re.compile(r"\s*,\s*")
 
+# Output roles tried in order; "main" is the role declared in recipe.json
+_OUTPUT_ROLES = ("main", "output", "out", "default", "dataset", "result")
+
+# Output columns written as doubles; everything else is a string
+NUMERIC_FIELDS = frozenset({
+    "current_cost",
+    "projected_cost",
+    "savings",
+    "savings_percent",
+    "confidence",
+    "confidence_score",
+    "total_savings",
+})
+
+# Stable default schema for consistency across runs, used when there is nothing to write
+_DEFAULT_COLS = (
+    "provider",
+    "resource_id",
+    "current_cost",
+    "projected_cost",
+    "savings_percent",
+    "savings",
+    "confidence_score",
+    "recommendation",
+    # run metadata
+    "run_id",
+    "run_timestamp",
+    "strategy",
+    "total_savings",
+)
+_PLACEHOLDER_SCHEMA = [
+    {"name": k, "type": ("double" if k in NUMERIC_FIELDS else "string")} for k in _DEFAULT_COLS
+]
+# Fingerprint of the last schema written per output dataset in this process
+_LAST_SCHEMA_HASH: Dict[str, str] = {}
+_PLACEHOLDER_ROW: Dict[str, Any] = {k: (0.0 if k in NUMERIC_FIELDS else "") for k in _DEFAULT_COLS}
+_PLACEHOLDER_ROW["recommendation"] = "No recommendations generated in this run"
+# Placeholder emitted by main() for an empty run; only the run metadata is filled in per run
+_EMPTY_PLACEHOLDER_TEMPLATE: Dict[str, Any] = {
+    "run_id": "",
+    "run_timestamp": "",
+    "strategy": "",
+    "total_savings": 0.0,
+    "recommendation": _PLACEHOLDER_ROW["recommendation"],
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _load_yaml_config(raw: str) -> Dict[str, Any]:
+    # Memoized on the raw text: repeated runs with unchanged config parse once
+    if not raw or yaml is None:
+        return {}
+    try:  # pragma: no cover - edge parsing
         return yaml.safe_load(raw) or {}
     except Exception:
         return {}
 
 
+def _parse_yaml_config(raw: str) -> Dict[str, Any]:
+    # The memoized dict is shared between runs; hand each caller its own copy
+    return copy.deepcopy(_load_yaml_config(raw))
+
+
+def _to_float(x: Any) -> float | None:
+    # Numbers skip the try/except; only strings and other types pay for float() parsing
+    if x is None or x == "":
+        return None
+    if isinstance(x, (int, float)):
+        return float(x)
+    try:
+        return float(x)
+    except (TypeError, ValueError):
+        return None
+
+
+# Agents built per plugin config, reused by back-to-back runs in the same Python
+# process (e.g. scenario retries); reset whenever the worker restarts
+_AGENT_CACHE: Dict[str, CloudOptimizerAgent] = {}
+_AGENT_CACHE_MAX = 4
+
+
 def _build_agent(pconf: Dict[str, Any]) -> CloudOptimizerAgent:
-    cfg = _parse_yaml_config(pconf.get("default_config_yaml"))
+    key = hashlib.blake2b(
+        json.dumps(pconf, sort_keys=True, default=str).encode("utf-8"), digest_size=16
+    ).hexdigest()
+    cached = _AGENT_CACHE.get(key)
+    if cached is not None:
+        return cached
+    agent = _new_agent(pconf)
+    # Only reuse fully authenticated agents: a transient credential failure must not
+    # keep that provider (and the agent's cached costs) around until the config changes
+    if agent.disabled_providers:
+        return agent
+    if len(_AGENT_CACHE) >= _AGENT_CACHE_MAX:
+        _AGENT_CACHE.clear()
+    _AGENT_CACHE[key] = agent
+    return agent
+
+
+def _new_agent(pconf: Dict[str, Any]) -> CloudOptimizerAgent:
+    cfg = _parse_yaml_config(pconf.get("default_config_yaml") or "")
     providers_cfg: Dict[str, Any] = cfg.get("providers", {}) if isinstance(cfg, dict) else {}
     strategies_cfg: Dict[str, Any] = cfg.get("strategies", {}) if isinstance(cfg, dict) else {}
 
     agent = CloudOptimizerAgent()
-    # Providers with optional per-provider configs
-    agent.register_provider("aws", AWSProvider(providers_cfg.get("aws")))
-    agent.register_provider("azure", AzureProvider(providers_cfg.get("azure")))
-    agent.register_provider("gcp", GCPProvider(providers_cfg.get("gcp")))
+    # Providers with optional per-provider configs. Only configured clouds are imported;
+    # without any provider config all three are registered as before.
+    wanted = [name for name in ("aws", "azure", "gcp") if not providers_cfg or name in providers_cfg]
+    providers: Dict[str, Any] = {}
+    if "aws" in wanted:
+        from dataiku_cloud_optimizer import AWSProvider
+
+        providers["aws"] = AWSProvider(providers_cfg.get("aws"))
+    if "azure" in wanted:
+        from dataiku_cloud_optimizer import AzureProvider
+
+        providers["azure"] = AzureProvider(providers_cfg.get("azure"))
+    if "gcp" in wanted:
+        from dataiku_cloud_optimizer import GCPProvider
+
+        providers["gcp"] = GCPProvider(providers_cfg.get("gcp"))
+    # Authenticates the providers concurrently, registration order is preserved
+    agent.register_providers(providers)
     # Strategy config
     cost_cfg = strategies_cfg.get("cost") if isinstance(strategies_cfg, dict) else None
     agent.register_strategy("cost", CostOptimizationStrategy(cost_cfg))
@@ -64,128 +188,119 @@ def _build_agent(pconf: Dict[str, Any]) -> CloudOptimizerAgent:
     if llm_connection or api_key:
         llm_model = pconf.get("llm_model") or "gpt-4o-mini"
         max_tokens = int(pconf.get("llm_max_tokens") or 512)
+        from dataiku_cloud_optimizer import SimpleLLM
+
         agent.llm = SimpleLLM(api_key=api_key, model=llm_model, max_tokens=max_tokens, llm_connection=llm_connection)  # type: ignore[attr-defined]
 
     # Notifications (optional)
     if pconf.get("notifications_enabled", True):
         slack_url = pconf.get("slack_webhook_url") or None
         if slack_url:
+            from dataiku_cloud_optimizer import SlackNotifier
+
             agent.register_notifier("slack", SlackNotifier(slack_url))  # type: ignore[attr-defined]
         emails = pconf.get("email_recipients") or ""
         if emails.strip():
+            from dataiku_cloud_optimizer import EmailNotifier
+
             agent.register_notifier("email", EmailNotifier(emails))  # type: ignore[attr-defined]
     return agent
 
 
-def _run_cost_optimization(agent: CloudOptimizerAgent, strategies: List[str]) -> List[Dict[str, Any]]:
-    # Currently only one strategy example; extend when multiple.
-    results: List[Dict[str, Any]] = []
+def _run_cost_optimization(agent: CloudOptimizerAgent, strategies: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+    # Currently only one strategy example; extend when multiple. Results are grouped per strategy.
+    results: Dict[str, List[Dict[str, Any]]] = {}
     for strat in strategies:
         if strat == "cost":
             recs = agent.run_strategy("cost")  # type: ignore[arg-type]
             if isinstance(recs, list):
-                for r in recs:
-                    if isinstance(r, dict):
-                        results.append(r)
+                results["cost"] = [r for r in recs if isinstance(r, dict)]
     return results
 
 
+def _schema_for(columns: List[str]) -> List[Dict[str, str]]:
+    return [{"name": k, "type": ("double" if k in NUMERIC_FIELDS else "string")} for k in columns]
+
+
+def _ensure_schema(ds: Any, dataset_name: str, schema: List[Dict[str, str]]) -> None:
+    # Schema writes refresh DSS metadata; skip them while the shape is unchanged in this process
+    sig = hashlib.blake2b(json.dumps(schema, sort_keys=True).encode("utf-8"), digest_size=8).hexdigest()
+    if _LAST_SCHEMA_HASH.get(dataset_name) != sig:
+        ds.write_schema(schema)
+        _LAST_SCHEMA_HASH[dataset_name] = sig
+
+
 def _write_output(dataset_name: str, rows: List[Dict[str, Any]]) -> None:
     ds = Dataset(dataset_name)
-    # Stable default schema for consistency across runs
-    default_cols = [
-        "provider",
-        "resource_id",
-        "current_cost",
-        "projected_cost",
-    "savings_percent",
-    "savings",
-    "confidence_score",
-    "recommendation",
-    # run metadata
-    "run_id",
-    "run_timestamp",
-    "strategy",
-    "total_savings",
-    ]
-    # Infer columns from union of keys, fallback to defaults when empty
-    all_keys: List[str] = []
-    seen = set()
-    for r in rows:
-        for k in r.keys():
-            if k not in seen:
-                seen.add(k)
-                all_keys.append(k)
-    if not all_keys:
-        all_keys = default_cols
-    # Prefer numeric types for known numeric fields
-    numeric_fields = {"current_cost", "projected_cost", "savings", "savings_percent", "confidence", "confidence_score", "total_savings"}
-    schema = [
-        {"name": k, "type": ("double" if k in numeric_fields else "string")}
-        for k in all_keys
-    ]
-    ds.write_schema(schema)
-
-    # Normalize rows to schema keys and string types
-    to_write: List[Dict[str, Any]] = []
-    if rows:
-        for r in rows:
-            row_out = {}
-            for k in all_keys:
-                v = r.get(k)
-                if k in {"current_cost", "projected_cost", "savings", "savings_percent", "confidence", "confidence_score", "total_savings"}:
-                    try:
-                        row_out[k] = None if v is None or v == "" else float(v)
-                    except Exception:
-                        row_out[k] = None
-                else:
-                    row_out[k] = "" if v is None else str(v)
-            to_write.append(row_out)
-    else:
-        to_write = [{k: (0.0 if k in {"current_cost", "projected_cost", "savings", "savings_percent", "confidence", "confidence_score", "total_savings"} else "") for k in all_keys}]
-        to_write[0]["recommendation"] = "No recommendations generated in this run"
-
-    with ds.get_writer() as w:
-        for r in to_write:
-            w.write_row_dict(r)
+    if not rows:
+        # Constant schema and row: nothing to infer or coerce
+        _ensure_schema(ds, dataset_name, _PLACEHOLDER_SCHEMA)
+        with ds.get_writer() as w:
+            w.write_row_dict(_PLACEHOLDER_ROW)
+        return
+    # Infer columns from union of keys
+    # dict.fromkeys keeps first-seen order and does the dedup in C
+    all_keys: List[str] = list(dict.fromkeys(k for r in rows for k in r))
+    numeric_cols = [k for k in all_keys if k in NUMERIC_FIELDS]
+    string_cols = [k for k in all_keys if k not in NUMERIC_FIELDS]
+    # Build the frame once and coerce whole columns (no per-cell Python loop); one bulk write.
+    # object dtype keeps ints as ints until coercion (no NaN-driven upcast to float)
+    df = pd.DataFrame(rows, dtype=object).reindex(columns=all_keys)
+    # Unparsable numbers become NaN (null), missing strings become ""
+    df[numeric_cols] = df[numeric_cols].apply(pd.to_numeric, errors="coerce")
+    # Fill first, then cast: one pass per column, no separate null mask
+    df[string_cols] = df[string_cols].fillna("").astype(str)
+    _ensure_schema(ds, dataset_name, _schema_for(all_keys))
+    ds.write_dataframe(df)
+
+
+def _load_configs() -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    # The two config lookups are independent, so overlap them; if the DSS bridge
+    # rejects concurrent use, redo them serially
+    try:
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            f_recipe = ex.submit(get_recipe_config)
+            f_plugin = ex.submit(get_plugin_config)
+            return f_recipe.result(), f_plugin.result()
+    except Exception:  # pragma: no cover - depends on DSS runtime
+        return get_recipe_config(), get_plugin_config()
 
 
 def main() -> None:
-    rconf = get_recipe_config()
-    pconf = get_plugin_config()
+    rconf, pconf = _load_configs()
 
     strategies_raw = rconf.get("strategies", "cost")
-    strategies = [s.strip() for s in strategies_raw.split(",") if s.strip()] or ["cost"]
+    strategies = [s for s in _STRATEGY_SEP.split(strategies_raw.strip()) if s] or ["cost"]
 
-    # Resolve output dataset with robust fallbacks
+    # Resolve output dataset: one get_recipe_output_names() call covers every role,
+    # per-role lookups are only a fallback when that mapping is unavailable
     output_names = []
     try:
-        output_names = get_output_names_for_role("main") or []
+        from dataiku import get_recipe_output_names  # type: ignore
+
+        mapping = get_recipe_output_names() or {}
     except Exception as e:  # pragma: no cover - defensive
-        print("DEBUG: get_output_names_for_role('main') failed:", e)
+        logger.debug("get_recipe_output_names failed: %s", e)
+        mapping = {}
+    for role in _OUTPUT_ROLES:
+        if mapping.get(role):
+            output_names = mapping[role]
+            break
     if not output_names:
-        for role in ("output", "out", "default", "dataset", "result"):
+        for key, names in mapping.items():
+            if names:
+                logger.debug("Using role %r with outputs %s", key, names)
+                output_names = names
+                break
+    if not output_names and not mapping:
+        for role in _OUTPUT_ROLES:
             try:
                 cand = get_output_names_for_role(role)
                 if cand:
-                    print(f"DEBUG: Found outputs via role '{role}': {cand}")
                     output_names = cand
                     break
             except Exception:
                 pass
-    if not output_names:
-        try:
-            from dataiku import get_recipe_output_names  # type: ignore
-
-            mapping = get_recipe_output_names()
-            print("DEBUG: get_recipe_output_names mapping:", mapping)
-            for key, names in mapping.items():
-                if names:
-                    print(f"DEBUG: Using role '{key}' with outputs {names}")
-                    output_names = names
-                    break
-        except Exception as e:
-            print("DEBUG: get_recipe_output_names failed:", e)
     if not output_names:
         raise RuntimeError(
             "No output dataset configured for this recipe (tried roles: main, output, out, default)"
@@ -193,7 +308,8 @@ def main() -> None:
     output_ds = output_names[0]
 
     agent = _build_agent(pconf)
-    recs = _run_cost_optimization(agent, strategies)
+    by_strategy = _run_cost_optimization(agent, strategies)
+    recs = [r for strat_recs in by_strategy.values() for r in strat_recs]
 
     # Serialize nested objects to JSON strings for consistency
     serializable_rows: List[Dict[str, Any]] = []
@@ -209,61 +325,57 @@ def main() -> None:
             return 0.0
 
     def _savings_value(r: Dict[str, Any]) -> float:
-        if "savings" in r and r["savings"] is not None:
-            try:
-                return float(r["savings"])  # absolute
-            except Exception:
-                pass
-        # try percent of current_cost
-        sp = r.get("savings_percent")
-        cc = r.get("current_cost")
-        pc = r.get("projected_cost")
-        if sp is not None and cc is not None:
-            try:
-                return float(cc) * float(sp) / 100.0
-            except Exception:
-                pass
-        if cc is not None and pc is not None:
-            try:
-                return float(cc) - float(pc)
-            except Exception:
-                pass
+        # Absolute savings, else percent of current_cost, else current - projected
+        s = _to_float(r.get("savings"))
+        if s is not None:
+            return s
+        cc = _to_float(r.get("current_cost"))
+        if cc is None:
+            return 0.0
+        sp = _to_float(r.get("savings_percent"))
+        if sp is not None:
+            return cc * sp / 100.0
+        pc = _to_float(r.get("projected_cost"))
+        if pc is not None:
+            return cc - pc
         return 0.0
 
-    # Normalize rows and attach metadata
+    # Single pass: normalize, attach metadata and compute each row's savings once
+    total_savings = 0.0
+    nested = (dict, list)
     for r in recs:
-        row: Dict[str, Any] = {}
-        for k, v in r.items():
-            if isinstance(v, (dict, list)):
-                row[k] = json.dumps(v)
-            else:
-                row[k] = v
+        # One pass over the row's items; nested values become JSON strings
+        row: Dict[str, Any] = {k: (_dumps(v) if isinstance(v, nested) else v) for k, v in r.items()}
         # Attach run metadata (will be added to schema in writer)
         row["run_id"] = run_id
         row["run_timestamp"] = run_ts
         row["strategy"] = strategy_label
+        savings = _savings_value(r)
+        row["_sort_savings"] = savings
+        total_savings += savings
         serializable_rows.append(row)
 
-    # Sort by best savings
-    serializable_rows.sort(key=_savings_value, reverse=True)
+    # Sort by best savings; with a top_k only the K best rows are kept (O(N log K))
+    top_k = int(rconf.get("top_k") or 0)
+    by_savings = operator.itemgetter("_sort_savings")
+    if 0 < top_k < len(serializable_rows):
+        serializable_rows = heapq.nlargest(top_k, serializable_rows, key=by_savings)
+    else:
+        serializable_rows.sort(key=by_savings, reverse=True)
 
-    # Total savings for the run (repeat per-row for convenience)
-    total_savings = sum(_savings_value(r) for r in serializable_rows)
+    # Total savings for the run over all rows, even when truncated (repeat per-row for convenience)
     for r in serializable_rows:
         r["total_savings"] = total_savings
+        del r["_sort_savings"]
 
     # Emit output (optionally with placeholder if empty)
     emit_placeholder = bool(rconf.get("emit_placeholder_on_empty", True))
     if serializable_rows or emit_placeholder:
         # Ensure placeholder rows also carry metadata
         if not serializable_rows:
-            serializable_rows = [{
-                "run_id": run_id,
-                "run_timestamp": run_ts,
-                "strategy": strategy_label,
-                "total_savings": 0.0,
-                "recommendation": "No recommendations generated in this run",
-            }]
+            row = _EMPTY_PLACEHOLDER_TEMPLATE.copy()
+            row.update(run_id=run_id, run_timestamp=run_ts, strategy=strategy_label)
+            serializable_rows = [row]
         _write_output(output_ds, serializable_rows)
 
     # Optional summary & notify (if configured)
@@ -271,17 +383,24 @@ def main() -> None:
         # Construct simple results object shape for summarization
         try:
             summary_base = f"Produced {len(serializable_rows)} recommendations across strategies {','.join(strategies)}"
-            if getattr(agent, "llm", None):
+            if getattr(agent, "llm", None) and len(strategies) > 1:
+                # One summary per strategy, batched into as few LLM calls as possible
+                items = [
+                    (
+                        f"Strategy {strat} produced {len(by_strategy.get(strat, []))} recommendations",
+                        {"strategy": strat, "count": len(by_strategy.get(strat, []))},
+                    )
+                    for strat in strategies
+                ]
+                final_summary = "\n".join(agent.llm.summarize_batch(items))  # type: ignore[attr-defined]
+            elif getattr(agent, "llm", None):
                 context = {"count": len(serializable_rows), "strategies": strategies}
                 final_summary = agent.llm.summarize(summary_base, context)  # type: ignore[attr-defined]
             else:
                 final_summary = summary_base
             if agent.notifiers:  # type: ignore[attr-defined]
-                for name, notifier in agent.notifiers.items():  # type: ignore[attr-defined]
-                    try:
-                        notifier.send(final_summary)
-                    except Exception:
-                        pass
+                # Sends to all notifiers concurrently; per-notifier failures are swallowed
+                agent.notify(final_summary)
         except Exception:
             pass
 
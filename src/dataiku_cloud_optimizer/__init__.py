@@ -8,10 +8,30 @@ __version__ = "0.1.0"
 __author__ = "Dataiku Cloud Optimizer Team"
 __email__ = "support@dataiku.com"
 
+import importlib
+from typing import Any
+
 from .core import CloudOptimizerAgent
-from .integrations import DatabricksIntegration, DataikuIntegration
-from .providers import AWSProvider, AzureProvider, GCPProvider
-from .strategies import CostOptimizationStrategy
+
+# Imported on first attribute access so callers only load the providers and
+# integrations (and their SDKs) they use
+_LAZY = {
+    "AWSProvider": ".providers.aws",
+    "AzureProvider": ".providers.azure",
+    "GCPProvider": ".providers.gcp",
+    "CostOptimizationStrategy": ".strategies.cost_optimization",
+    "DataikuIntegration": ".integrations.dataiku",
+    "DatabricksIntegration": ".integrations.databricks",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "CloudOptimizerAgent",
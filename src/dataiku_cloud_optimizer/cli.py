@@ -5,19 +5,61 @@ Command Line Interface for Dataiku Cloud Optimizer Agent
 import json
 import os
 from pathlib import Path
+from typing import Dict, Type
 
 import click
-import uvicorn
-
-from .core import CloudOptimizerAgent
+import yaml
+
+# Provider and integration modules are light; their cloud SDKs load on first client use.
+# The web server, scheduler, LLM (openai) and notifier (slack_sdk) stacks are imported
+# only by the commands / config branches that use them.
+from .core import (
+    DEFAULT_COST_CACHE_TTL,
+    DEFAULT_MAX_CONTEXT_RESULTS,
+    CloudOptimizerAgent,
+    OptimizationResult,
+)
 from .integrations import DatabricksIntegration, DataikuIntegration
 from .providers import AWSProvider, AzureProvider, GCPProvider
-from .scheduler import AgentScheduler
+from .providers.base import CloudProvider
 from .strategies import CostOptimizationStrategy
-from .utils.config import load_config
-from .utils.llm import LLMEngine
-from .utils.notify import EmailNotifier, SlackNotifier
-from .webapp import create_app
+from .utils.config import YAML_DUMPER, load_config
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - declared dependency; stdlib json fallback
+    orjson = None  # type: ignore[assignment]
+
+
+def _json_default(obj):
+    """stdlib json fallback for what orjson encodes natively"""
+    if isinstance(obj, OptimizationResult):
+        return obj.to_dict()
+    return str(obj)
+
+
+def _json_dumps(obj):
+    """Pretty-print JSON output, via orjson when it is installed"""
+    if orjson is not None:
+        # orjson walks (slotted) dataclasses and datetimes in C, no to_dict() needed.
+        # Naive datetimes are local time, so they are not tagged as UTC
+        return orjson.dumps(
+            obj, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode("utf-8")
+    return json.dumps(obj, indent=2, default=_json_default)
+
+
+def _json_stream(items):
+    """Write a JSON array to stdout one compact element at a time"""
+    # click.echo passes bytes straight to the binary stdout buffer
+    click.echo(b"[", nl=False)
+    for i, item in enumerate(items):
+        if orjson is not None:
+            line = orjson.dumps(item, default=str)
+        else:
+            line = json.dumps(item, default=_json_default).encode("utf-8")
+        click.echo((b",\n" if i else b"\n") + line, nl=False)
+    click.echo(b"\n]")
 
 
 @click.group()
@@ -32,9 +74,6 @@ def cli(ctx, config):
     """Dataiku Cloud Optimizer Agent CLI"""
     ctx.ensure_object(dict)
 
-    # Initialize the agent
-    agent = CloudOptimizerAgent()
-
     # Load configuration if provided
     if config:
         config_data = load_config(config)
@@ -42,17 +81,56 @@ def cli(ctx, config):
     else:
         ctx.obj["config"] = {}
 
+    # The agent is built on first use by _get_agent, with only the providers
+    # the invoked subcommand needs
+    ctx.obj["agent"] = None
+
+
+ALL_PROVIDERS = ("aws", "azure", "gcp")
+PROVIDER_CLASSES: Dict[str, Type[CloudProvider]] = {
+    "aws": AWSProvider,
+    "azure": AzureProvider,
+    "gcp": GCPProvider,
+}
+
+# Shared option types, built once for every command
+_PROVIDER_CHOICE = click.Choice(ALL_PROVIDERS)
+_OUTPUT_CHOICE = click.Choice(("json", "table"))
+
+
+def _get_agent(ctx, providers=None):
+    """Return the invocation's agent, building it with the given providers on first use.
+
+    ``providers=None`` (or an empty filter) registers all supported providers.
+    """
+    agent = ctx.obj.get("agent")
+    if agent is None:
+        agent = _build_agent(ctx.obj["config"], providers or ALL_PROVIDERS)
+        ctx.obj["agent"] = agent
+    return agent
+
+
+def _build_agent(config, providers):
+    providers_cfg = config.get("providers", {})
+    llm_cfg = config.get("llm", {})
+    agent = CloudOptimizerAgent(
+        cost_cache_ttl=float(
+            providers_cfg.get("cache_ttl_seconds", DEFAULT_COST_CACHE_TTL)
+        ),
+        max_context_results=int(
+            llm_cfg.get("max_context_results", DEFAULT_MAX_CONTEXT_RESULTS)
+        ),
+    )
+
     # Register providers (use config if available)
-    providers_cfg = ctx.obj["config"].get("providers", {})
-    agent.register_provider("aws", AWSProvider(providers_cfg.get("aws")))
-    agent.register_provider("azure", AzureProvider(providers_cfg.get("azure")))
-    agent.register_provider("gcp", GCPProvider(providers_cfg.get("gcp")))
+    for name in providers:
+        agent.register_provider(name, PROVIDER_CLASSES[name](providers_cfg.get(name)))
 
     # Register default strategy
     agent.register_strategy("cost_optimization", CostOptimizationStrategy())
 
     # Register integrations (pass config)
-    integrations_cfg = ctx.obj["config"].get("integrations", {})
+    integrations_cfg = config.get("integrations", {})
     agent.register_integration(
         "dataiku", DataikuIntegration(integrations_cfg.get("dataiku"))
     )
@@ -61,22 +139,27 @@ def cli(ctx, config):
     )
 
     # Wire optional LLM and notifiers
-    llm_cfg = ctx.obj["config"].get("llm", {})
     if llm_cfg.get("provider") == "openai":
         api_key = llm_cfg.get("api_key") or os.getenv("OPENAI_API_KEY")
         model = llm_cfg.get("model", "gpt-4o-mini")
         if api_key:
+            from .utils.llm import LLMEngine
+
             agent.register_llm(LLMEngine(api_key=api_key, model=model))
 
-    notify_cfg = ctx.obj["config"].get("notifications", {})
+    notify_cfg = config.get("notifications", {})
     slack_cfg = notify_cfg.get("slack", {})
     if slack_cfg.get("enabled"):
+        from .utils.notify import SlackNotifier
+
         slack = SlackNotifier(
             token=slack_cfg.get("token"), channel=slack_cfg.get("channel")
         )
         agent.register_notifier("slack", slack)
     email_cfg = notify_cfg.get("email", {})
     if email_cfg.get("enabled"):
+        from .utils.notify import EmailNotifier
+
         email = EmailNotifier(
             smtp_host=email_cfg.get("smtp_host", ""),
             smtp_port=int(email_cfg.get("smtp_port", 587)),
@@ -88,18 +171,18 @@ def cli(ctx, config):
         )
         agent.register_notifier("email", email)
 
-    ctx.obj["agent"] = agent
+    return agent
 
 
 @cli.command()
-@click.option("--provider", type=click.Choice(["aws", "azure", "gcp"]), required=True)
+@click.option("--provider", type=_PROVIDER_CHOICE, required=True)
 @click.option("--start-date", help="Start date for cost analysis (YYYY-MM-DD)")
 @click.option("--end-date", help="End date for cost analysis (YYYY-MM-DD)")
-@click.option("--output", type=click.Choice(["json", "table"]), default="table")
+@click.option("--output", type=_OUTPUT_CHOICE, default="table")
 @click.pass_context
 def analyze(ctx, provider, start_date, end_date, output):
     """Analyze cloud costs for a specific provider"""
-    agent = ctx.obj["agent"]
+    agent = _get_agent(ctx, [provider])
 
     try:
         kwargs = {}
@@ -111,7 +194,7 @@ def analyze(ctx, provider, start_date, end_date, output):
         cost_data = agent.analyze_costs(provider, **kwargs)
 
         if output == "json":
-            click.echo(json.dumps(cost_data, indent=2, default=str))
+            click.echo(_json_dumps(cost_data))
         else:
             click.echo(f"\n=== Cost Analysis for {provider.upper()} ===")
             click.echo(f"Total Cost: ${cost_data.get('total_cost', 0):.2f}")
@@ -124,39 +207,28 @@ def analyze(ctx, provider, start_date, end_date, output):
 
 
 @cli.command()
-@click.option("--provider", type=click.Choice(["aws", "azure", "gcp"]), required=True)
+@click.option("--provider", type=_PROVIDER_CHOICE, required=True)
 @click.option(
     "--strategy", default="cost_optimization", help="Optimization strategy to use"
 )
-@click.option("--output", type=click.Choice(["json", "table"]), default="table")
+@click.option("--output", type=_OUTPUT_CHOICE, default="table")
 @click.pass_context
 def optimize(ctx, provider, strategy, output):
     """Run optimization analysis for a specific provider"""
-    agent = ctx.obj["agent"]
+    agent = _get_agent(ctx, [provider])
 
     try:
         result = agent.optimize(provider, strategy)
 
         if output == "json":
-            # Convert dataclass to dict for JSON serialization
-            result_dict = {
-                "provider": result.provider,
-                "resource_type": result.resource_type,
-                "current_cost": result.current_cost,
-                "optimized_cost": result.optimized_cost,
-                "savings": result.savings,
-                "recommendations": result.recommendations,
-                "confidence_score": result.confidence_score,
-                "timestamp": result.timestamp.isoformat(),
-            }
-            click.echo(json.dumps(result_dict, indent=2))
+            click.echo(_json_dumps(result))
         else:
             click.echo(f"\n=== Optimization Results for {result.provider.upper()} ===")
             click.echo(f"Resource Type: {result.resource_type}")
             click.echo(f"Current Cost: ${result.current_cost:.2f}")
             click.echo(f"Optimized Cost: ${result.optimized_cost:.2f}")
             click.echo(
-                f"Potential Savings: ${result.savings:.2f} ({result.savings / result.current_cost * 100:.1f}%)"
+                f"Potential Savings: ${result.savings:.2f} ({result.savings_percent:.1f}%)"
             )
             click.echo(f"Confidence Score: {result.confidence_score:.1%}")
             click.echo("\nRecommendations:")
@@ -171,34 +243,27 @@ def optimize(ctx, provider, strategy, output):
 @cli.command()
 @click.option(
     "--provider",
-    type=click.Choice(["aws", "azure", "gcp"]),
+    type=_PROVIDER_CHOICE,
     help="Specific provider to get recommendations for",
 )
-@click.option("--output", type=click.Choice(["json", "table"]), default="table")
+@click.option("--output", type=_OUTPUT_CHOICE, default="table")
+@click.option(
+    "--stream",
+    is_flag=True,
+    help="With --output json, write one compact result per line instead of a pretty document",
+)
 @click.pass_context
-def recommendations(ctx, provider, output):
+def recommendations(ctx, provider, output, stream):
     """Get optimization recommendations"""
-    agent = ctx.obj["agent"]
+    agent = _get_agent(ctx, [provider] if provider else None)
 
     try:
         results = agent.get_recommendations(provider)
 
-        if output == "json":
-            results_list = []
-            for result in results:
-                results_list.append(
-                    {
-                        "provider": result.provider,
-                        "resource_type": result.resource_type,
-                        "current_cost": result.current_cost,
-                        "optimized_cost": result.optimized_cost,
-                        "savings": result.savings,
-                        "recommendations": result.recommendations,
-                        "confidence_score": result.confidence_score,
-                        "timestamp": result.timestamp.isoformat(),
-                    }
-                )
-            click.echo(json.dumps(results_list, indent=2))
+        if output == "json" and stream:
+            _json_stream(results)
+        elif output == "json":
+            click.echo(_json_dumps(results))
         else:
             if not results:
                 click.echo("No recommendations available.")
@@ -257,6 +322,7 @@ def init(output):
             "provider": "openai",
             "model": "gpt-4o-mini",
             "api_key": "${OPENAI_API_KEY}",
+            "max_context_results": DEFAULT_MAX_CONTEXT_RESULTS,
         },
         "notifications": {
             "slack": {
@@ -280,10 +346,10 @@ def init(output):
 
     output_path = Path(output) if output else Path("config.yaml")
 
-    import yaml
-
     with open(output_path, "w") as f:
-        yaml.dump(sample_config, f, default_flow_style=False, indent=2)
+        yaml.dump(
+            sample_config, f, Dumper=YAML_DUMPER, default_flow_style=False, indent=2
+        )
 
     click.echo(f"Sample configuration written to {output_path}")
 
@@ -292,11 +358,11 @@ def init(output):
 @click.option(
     "--channels", help="Comma-separated notifier names to use (e.g. slack,email)"
 )
-@click.option("--provider", type=click.Choice(["aws", "azure", "gcp"]))
+@click.option("--provider", type=_PROVIDER_CHOICE)
 @click.pass_context
 def proactive(ctx, channels, provider):
     """Run a proactive cycle: analyze -> summarize -> notify"""
-    agent = ctx.obj["agent"]
+    agent = _get_agent(ctx, [provider] if provider else None)
     channel_list = [c.strip() for c in channels.split(",")] if channels else None
     outcome = agent.run_proactive_cycle(provider=provider, channels=channel_list)
     click.echo(outcome["summary"])
@@ -310,10 +376,16 @@ def proactive(ctx, channels, provider):
 @click.pass_context
 def serve(ctx, host, port):
     """Start the FastAPI web server"""
-    agent = ctx.obj["agent"]
+    import uvicorn
+
+    from .webapp import create_app
+
+    agent = _get_agent(ctx)
     # Optionally start scheduler
     sched_cfg = ctx.obj["config"].get("scheduler", {})
     if sched_cfg.get("enabled"):
+        from .scheduler import AgentScheduler
+
         scheduler = AgentScheduler(agent)
         scheduler.start(
             interval_minutes=int(sched_cfg.get("interval_minutes", 1440)),
@@ -2,19 +2,44 @@
 Core module for the Dataiku Cloud Optimizer Agent
 """
 
-from dataclasses import dataclass
+import heapq
+import logging
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from copy import deepcopy
+from dataclasses import dataclass, fields
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
 from .integrations.base import Integration
 from .providers.base import CloudProvider
 from .strategies.base import OptimizationStrategy
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# Default lifetime of cached provider cost data, in seconds
+DEFAULT_COST_CACHE_TTL = 3600.0
+# Default number of top-savings results sent to the LLM as context
+DEFAULT_MAX_CONTEXT_RESULTS = 10
+
+
+@dataclass(frozen=True)
 class OptimizationResult:
     """Result of an optimization analysis"""
 
+    # Explicit __slots__ (dataclass(slots=True) needs Python 3.10); fields have no defaults
+    __slots__ = (
+        "provider",
+        "resource_type",
+        "current_cost",
+        "optimized_cost",
+        "savings",
+        "recommendations",
+        "confidence_score",
+        "timestamp",
+    )
+
     provider: str
     resource_type: str
     current_cost: float
@@ -24,23 +49,116 @@ class OptimizationResult:
     confidence_score: float
     timestamp: datetime
 
+    def __post_init__(self) -> None:
+        # Provider / resource type names come from a tiny set; share one string each.
+        # Strategies are not type-checked, so anything other than a str is kept as is
+        for name in ("provider", "resource_type"):
+            value = getattr(self, name)
+            if isinstance(value, str):
+                object.__setattr__(self, name, sys.intern(value))
+
+    # Frozen + hand-written __slots__: copy/deepcopy/pickle would restore state via
+    # setattr and hit FrozenInstanceError, so state is a plain tuple of field values
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+    @property
+    def savings_percent(self) -> float:
+        """Savings as a percentage of current cost (0.0 when there is no cost)"""
+        if not self.current_cost:
+            return 0.0
+        return self.savings / self.current_cost * 100.0
+
+    if TYPE_CHECKING:
+        # Generated from the dataclass fields below the class
+        def to_dict(self) -> Dict[str, Any]: ...
+
+
+# Field names in declaration order, resolved once at import
+_FIELDS = tuple(f.name for f in fields(OptimizationResult))
+
+# Fields whose JSON form differs from the attribute itself
+_TO_DICT_EXPRS = {
+    "recommendations": "list(self.recommendations)",
+    "timestamp": "self.timestamp.isoformat()",
+}
+
+
+def _compile_to_dict() -> Callable[[OptimizationResult], Dict[str, Any]]:
+    """Build a to_dict with one literal dict display, so new fields need no hand edits"""
+    items = ", ".join(
+        f"{name!r}: {_TO_DICT_EXPRS.get(name, 'self.' + name)}" for name in _FIELDS
+    )
+    namespace: Dict[str, Any] = {}
+    exec(f"def to_dict(self):\n    return {{{items}}}\n", namespace)  # nosec B102
+    to_dict = namespace["to_dict"]
+    to_dict.__qualname__ = "OptimizationResult.to_dict"
+    to_dict.__module__ = __name__
+    to_dict.__doc__ = (
+        "JSON-ready dict of the result (shallow, no dataclasses.asdict deepcopy)"
+    )
+    return to_dict
+
+
+OptimizationResult.to_dict = _compile_to_dict()  # type: ignore[assignment]
+
 
 class CloudOptimizerAgent:
     """
     Main agent class that orchestrates cloud optimization across multiple providers
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        cost_cache_ttl: float = DEFAULT_COST_CACHE_TTL,
+        max_context_results: int = DEFAULT_MAX_CONTEXT_RESULTS,
+    ) -> None:
         self.providers: Dict[str, CloudProvider] = {}
         self.strategies: Dict[str, OptimizationStrategy] = {}
         self.integrations: Dict[str, Integration] = {}
         # Optional components wired at runtime
         self.llm: Any = None
         self.notifiers: Dict[str, Any] = {}
+        self.max_context_results = max_context_results
+        # Cost data per (provider, kwargs) -> (monotonic_ts, data); ttl <= 0 disables
+        self.cost_cache_ttl = cost_cache_ttl
+        self._cost_cache: Dict[Tuple[Any, ...], Tuple[float, Dict[str, Any]]] = {}
 
     def register_provider(self, name: str, provider: CloudProvider) -> None:
         """Register a cloud provider"""
         self.providers[name] = provider
+        self.clear_cost_cache(name)
+
+    def clear_cost_cache(self, provider_name: Optional[str] = None) -> None:
+        """Drop cached cost data for one provider, or for all providers"""
+        if provider_name is None:
+            self._cost_cache.clear()
+            return
+        for key in [k for k in self._cost_cache if k[0] == provider_name]:
+            del self._cost_cache[key]
+
+    def _get_cost_data(
+        self, provider_name: str, provider: CloudProvider, kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Fetch cost data through the TTL cache (callers always get a private copy)"""
+        if self.cost_cache_ttl <= 0:
+            return provider.get_cost_data(**kwargs)
+        key = (provider_name, tuple(sorted(kwargs.items())))
+        try:
+            hit = self._cost_cache.get(key)
+        except TypeError:  # unhashable kwargs: skip the cache
+            return provider.get_cost_data(**kwargs)
+        now = time.monotonic()
+        if hit is not None and now - hit[0] < self.cost_cache_ttl:
+            return deepcopy(hit[1])
+        data = provider.get_cost_data(**kwargs)
+        # Cache a copy so mutating this result cannot leak into later calls
+        self._cost_cache[key] = (now, deepcopy(data))
+        return data
 
     def register_strategy(self, name: str, strategy: OptimizationStrategy) -> None:
         """Register an optimization strategy"""
@@ -60,26 +178,24 @@ class CloudOptimizerAgent:
 
     def analyze_costs(self, provider_name: str, **kwargs: Any) -> Dict[str, Any]:
         """Analyze costs for a specific provider"""
-        if provider_name not in self.providers:
+        provider = self.providers.get(provider_name)
+        if provider is None:
             raise ValueError(f"Provider {provider_name} not registered")
-
-        provider = self.providers[provider_name]
-        return provider.get_cost_data(**kwargs)
+        return self._get_cost_data(provider_name, provider, kwargs)
 
     def optimize(
         self, provider_name: str, strategy_name: str, **kwargs: Any
     ) -> OptimizationResult:
         """Run optimization for a specific provider using a strategy"""
-        if provider_name not in self.providers:
+        provider = self.providers.get(provider_name)
+        if provider is None:
             raise ValueError(f"Provider {provider_name} not registered")
-        if strategy_name not in self.strategies:
+        strategy = self.strategies.get(strategy_name)
+        if strategy is None:
             raise ValueError(f"Strategy {strategy_name} not registered")
 
-        provider = self.providers[provider_name]
-        strategy = self.strategies[strategy_name]
-
         # Get current cost data
-        cost_data = provider.get_cost_data(**kwargs)
+        cost_data = self._get_cost_data(provider_name, provider, kwargs)
 
         # Apply optimization strategy
         optimization = strategy.optimize(cost_data)
@@ -99,24 +215,32 @@ class CloudOptimizerAgent:
         self, provider_name: Optional[str] = None
     ) -> List[OptimizationResult]:
         """Get optimization recommendations for one or all providers"""
-        results = []
+        results: List[OptimizationResult] = []
 
         providers_to_check = (
             [provider_name] if provider_name else list(self.providers.keys())
         )
 
-        for prov_name in providers_to_check:
-            if prov_name in self.providers:
-                # Use the first available strategy for basic recommendations
-                if self.strategies:
-                    strategy_name = list(self.strategies.keys())[0]
-                    try:
-                        result = self.optimize(prov_name, strategy_name)
-                        results.append(result)
-                    except Exception as e:
-                        # Log error but continue with other providers
-                        print(f"Error optimizing {prov_name}: {e}")
+        names = [p for p in providers_to_check if p in self.providers]
+        if not names or not self.strategies:
+            return results
+        # Use the first available strategy for basic recommendations
+        strategy_name = next(iter(self.strategies))
+
+        # Provider calls are network-bound, so run them concurrently
+        by_provider: Dict[str, OptimizationResult] = {}
+        with ThreadPoolExecutor(max_workers=len(names)) as ex:
+            futures = {ex.submit(self.optimize, p, strategy_name): p for p in names}
+            for fut in as_completed(futures):
+                prov_name = futures[fut]
+                try:
+                    by_provider[prov_name] = fut.result()
+                except Exception:
+                    # Log error but continue with other providers
+                    logger.exception("Error optimizing %s", prov_name)
 
+        # Keep provider order regardless of completion order
+        results.extend(by_provider[p] for p in names if p in by_provider)
         return results
 
     # --- Proactive agent capabilities ---
@@ -129,13 +253,18 @@ class CloudOptimizerAgent:
         if not results:
             return "No optimization opportunities were found."
 
+        # Rank once; the top slice feeds both the fallback lines and the LLM context
+        # (without an LLM only the five fallback lines are needed)
+        n_top = 5 if self.llm is None else max(self.max_context_results, 5)
+        top = heapq.nlargest(n_top, results, key=lambda r: r.savings)
+
         # Fallback summary without LLM
         base_summary = []
         total_savings = sum(r.savings for r in results)
         base_summary.append(
             f"Found {len(results)} opportunities across providers with total potential savings ${total_savings:,.2f}."
         )
-        for r in results[:5]:
+        for r in top[:5]:
             base_summary.append(
                 f"- {r.provider.upper()}: save ${r.savings:,.2f} on {r.resource_type}; confidence {r.confidence_score:.0%}."
             )
@@ -157,32 +286,51 @@ class CloudOptimizerAgent:
                         "recommendations": r.recommendations[:3],
                         "confidence": r.confidence_score,
                     }
-                    for r in results
+                    for r in top[: self.max_context_results]
                 ],
             }
             return self.llm.summarize(summary_text, ctx)
-        except Exception as e:
+        except Exception:
             # Fallback to base summary on failure
-            print(f"LLM summarization failed: {e}")
+            logger.exception("LLM summarization failed")
             return summary_text
 
+    def summary_highlights(
+        self, results: List[OptimizationResult], limit: int = 5
+    ) -> List[Dict[str, Any]]:
+        """Top results by savings as plain dicts, for notifiers that render rich messages"""
+        top = heapq.nlargest(limit, results, key=lambda r: r.savings)
+        return [
+            {
+                "provider": r.provider,
+                "resource_type": r.resource_type,
+                "savings": r.savings,
+                "confidence": r.confidence_score,
+            }
+            for r in top
+        ]
+
     def notify(
         self, message: str, channels: Optional[List[str]] = None, **kwargs: Any
     ) -> Dict[str, bool]:
         """Send a notification message to one or more registered channels"""
-        results: Dict[str, bool] = {}
         targets = channels or list(self.notifiers.keys())
-        for name in targets:
-            notifier = self.notifiers.get(name)
-            if notifier is None:
-                results[name] = False
-                continue
-            try:
-                notifier.send(message, **kwargs)
-                results[name] = True
-            except Exception as e:
-                print(f"Notifier '{name}' failed: {e}")
-                results[name] = False
+        # Pre-fill in target order; unknown channels stay False
+        results: Dict[str, bool] = dict.fromkeys(targets, False)
+        known = [(t, self.notifiers[t]) for t in results if t in self.notifiers]
+        if not known:
+            return results
+
+        # Sends are I/O-bound (HTTP, SMTP), so overlap them
+        with ThreadPoolExecutor(max_workers=len(known)) as ex:
+            futures = {ex.submit(n.send, message, **kwargs): name for name, n in known}
+            for fut in as_completed(futures):
+                name = futures[fut]
+                try:
+                    fut.result()
+                    results[name] = True
+                except Exception:
+                    logger.exception("Notifier '%s' failed", name)
         return results
 
     def run_proactive_cycle(
@@ -194,5 +342,7 @@ class CloudOptimizerAgent:
         """End-to-end cycle: collect -> optimize -> summarize -> notify"""
         results = self.get_recommendations(provider)
         summary = self.summarize_results(results, org_context)
-        notify_status = self.notify(summary, channels)
+        notify_status = self.notify(
+            summary, channels, highlights=self.summary_highlights(results)
+        )
         return {"summary": summary, "notify": notify_status, "count": len(results)}
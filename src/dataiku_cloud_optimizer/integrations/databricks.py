@@ -3,16 +3,241 @@ Databricks Integration
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+from collections import defaultdict
+from copy import deepcopy
+from typing import Any, Callable, Dict, List, Optional
 
 from .base import Integration
 
 logger = logging.getLogger(__name__)
 
+# Stub payloads are built once at import and shared between calls; callers that
+# need to mutate the result pass copy=True to get a private deep copy
+_WORKLOAD_DATA = [
+    {
+        "job_id": 12345,
+        "job_name": "daily_etl_pipeline",
+        "run_id": 67890,
+        "start_time": "2024-12-01T03:00:00Z",
+        "end_time": "2024-12-01T05:45:00Z",
+        "duration_minutes": 165,
+        "state": "SUCCESS",
+        "cluster_id": "0801-123456-abc123",
+        "cluster_spec": {
+            "node_type_id": "i3.xlarge",
+            "num_workers": 6,
+            "driver_node_type_id": "i3.xlarge",
+            "spark_version": "13.3.x-scala2.12",
+        },
+        "resource_usage": {
+            "dbu_hours": 28.5,
+            "compute_cost": 142.50,
+            "total_cost": 156.75,
+        },
+        "notebook_path": "/Workflows/ETL/daily_processing",
+    },
+    {
+        "job_id": 54321,
+        "job_name": "ml_feature_engineering",
+        "run_id": 98765,
+        "start_time": "2024-12-01T10:00:00Z",
+        "end_time": "2024-12-01T11:30:00Z",
+        "duration_minutes": 90,
+        "state": "SUCCESS",
+        "cluster_id": "0801-987654-def456",
+        "cluster_spec": {
+            "node_type_id": "r5d.2xlarge",
+            "num_workers": 4,
+            "driver_node_type_id": "r5d.xlarge",
+            "spark_version": "13.3.x-scala2.12",
+        },
+        "resource_usage": {
+            "dbu_hours": 16.5,
+            "compute_cost": 82.50,
+            "total_cost": 90.75,
+        },
+        "notebook_path": "/ML/feature_engineering",
+    },
+]
+
+_RESOURCE_USAGE = {
+    "clusters": [
+        {
+            "cluster_id": "0801-123456-abc123",
+            "cluster_name": "etl-production",
+            "cluster_source": "JOB",
+            "state": "TERMINATED",
+            "node_type_id": "i3.xlarge",
+            "num_workers": 6,
+            "avg_cpu_utilization": 72.3,
+            "avg_memory_utilization": 68.9,
+            "uptime_hours": 168,  # 7 days
+            "idle_time_hours": 42,  # 25% idle
+            "total_dbu_hours": 336.0,
+            "total_cost": 1680.00,
+            "autoscaling": {"min_workers": 2, "max_workers": 8},
+        },
+        {
+            "cluster_id": "0801-987654-def456",
+            "cluster_name": "ml-experimentation",
+            "cluster_source": "UI",
+            "state": "RUNNING",
+            "node_type_id": "r5d.2xlarge",
+            "num_workers": 4,
+            "avg_cpu_utilization": 45.6,
+            "avg_memory_utilization": 52.1,
+            "uptime_hours": 120,  # 5 days
+            "idle_time_hours": 36,  # 30% idle
+            "total_dbu_hours": 240.0,
+            "total_cost": 1200.00,
+            "autoscaling": {"min_workers": 1, "max_workers": 6},
+        },
+    ],
+    "summary": {
+        "total_clusters": 2,
+        "total_dbu_hours": 576.0,
+        "total_cost": 2880.00,
+        "avg_utilization": 58.9,
+        "idle_time_percent": 27.5,
+    },
+}
+
+_JOBS = [
+    {
+        "job_id": 12345,
+        "job_name": "daily_etl_pipeline",
+        "schedule": "0 3 * * *",  # Daily at 3 AM
+        "timeout_seconds": 21600,  # 6 hours
+        "max_concurrent_runs": 1,
+        "cluster_spec": {
+            "new_cluster": {
+                "node_type_id": "i3.xlarge",
+                "num_workers": 6,
+                "spark_version": "13.3.x-scala2.12",
+            }
+        },
+        "notebook_task": {"notebook_path": "/Workflows/ETL/daily_processing"},
+        "avg_runtime_minutes": 165,
+        "success_rate": 0.97,
+        "monthly_cost": 1250.00,
+    },
+    {
+        "job_id": 54321,
+        "job_name": "ml_feature_engineering",
+        "schedule": None,  # Manual trigger
+        "timeout_seconds": 7200,  # 2 hours
+        "max_concurrent_runs": 3,
+        "cluster_spec": {"existing_cluster_id": "0801-987654-def456"},
+        "notebook_task": {"notebook_path": "/ML/feature_engineering"},
+        "avg_runtime_minutes": 90,
+        "success_rate": 0.94,
+        "monthly_cost": 560.00,
+    },
+]
+
+_NOTEBOOKS = [
+    {
+        "path": "/Workflows/ETL/daily_processing",
+        "language": "python",
+        "last_modified": "2024-11-28T15:30:00Z",
+        "execution_count": 30,
+        "avg_execution_time": 165,
+        "resource_profile": "compute_intensive",
+        "associated_jobs": [12345],
+    },
+    {
+        "path": "/ML/feature_engineering",
+        "language": "python",
+        "last_modified": "2024-11-30T09:15:00Z",
+        "execution_count": 15,
+        "avg_execution_time": 90,
+        "resource_profile": "memory_intensive",
+        "associated_jobs": [54321],
+    },
+    {
+        "path": "/Analytics/exploratory_analysis",
+        "language": "sql",
+        "last_modified": "2024-12-01T11:00:00Z",
+        "execution_count": 8,
+        "avg_execution_time": 45,
+        "resource_profile": "interactive",
+        "associated_jobs": [],
+    },
+]
+
+_WORKSPACE_USAGE = {
+    "workspace_id": "1234567890123456",
+    "region": "us-east-1",
+    "pricing_tier": "PREMIUM",
+    "monthly_statistics": {
+        "total_dbu_hours": 2880.0,
+        "compute_cost": 14400.00,
+        "storage_cost": 125.50,
+        "total_cost": 14525.50,
+        "job_runs": 145,
+        "interactive_clusters": 8,
+        "automated_clusters": 12,
+    },
+    "cost_breakdown": {
+        "jobs": 12650.00,
+        "interactive": 1875.50,
+        "storage": 125.50,
+    },
+    "optimization_opportunities": {
+        "idle_clusters": 3,
+        "oversized_clusters": 2,
+        "potential_savings": 1850.75,
+    },
+}
+
+
+def _apply_rightsizing(recs: List[Dict[str, Any]]) -> None:
+    # Simulate cluster rightsizing (one log line per batch)
+    if logger.isEnabledFor(logging.INFO):
+        changes = ", ".join(
+            f"{r.get('cluster_id', '')} ({r.get('current_node_type', '')}"
+            f" -> {r.get('recommended_node_type', '')})"
+            for r in recs
+        )
+        logger.info("Rightsizing %d cluster(s): %s", len(recs), changes)
+
+
+def _apply_autoscaling(recs: List[Dict[str, Any]]) -> None:
+    # Simulate autoscaling optimization
+    if logger.isEnabledFor(logging.INFO):
+        changes = ", ".join(
+            f"{r.get('cluster_id', '')} ({r.get('recommended_min_workers', 1)}"
+            f"-{r.get('recommended_max_workers', 5)} workers)"
+            for r in recs
+        )
+        logger.info("Updating autoscaling for %d cluster(s): %s", len(recs), changes)
+
+
+def _apply_terminate_idle(recs: List[Dict[str, Any]]) -> None:
+    # Simulate idle cluster termination
+    if logger.isEnabledFor(logging.INFO):
+        ids = ", ".join(r.get("cluster_id", "") for r in recs)
+        logger.info("Terminating %d idle cluster(s): %s", len(recs), ids)
+
+
+def _apply_spot_instances(recs: List[Dict[str, Any]]) -> None:
+    # Simulate spot instance configuration
+    if logger.isEnabledFor(logging.INFO):
+        ids = ", ".join(r.get("cluster_id", "") for r in recs)
+        logger.info("Enabling spot instances for %d cluster(s): %s", len(recs), ids)
+
 
 class DatabricksIntegration(Integration):
     """Integration with Databricks platform"""
 
+    # Recommendation type -> handler; unknown types are skipped
+    _HANDLERS: Dict[str, Callable[[List[Dict[str, Any]]], None]] = {
+        "rightsizing": _apply_rightsizing,
+        "autoscaling": _apply_autoscaling,
+        "terminate_idle": _apply_terminate_idle,
+        "spot_instances": _apply_spot_instances,
+    }
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         super().__init__(config)
         self.workspace_url = self.config.get("workspace_url", "")
@@ -21,9 +246,13 @@ class DatabricksIntegration(Integration):
 
     def authenticate(self) -> bool:
         """Authenticate with Databricks API"""
+        # Already authenticated: skip the auth flow and its logging
+        if self._authenticated:
+            return True
+
         try:
             # In a real implementation, this would use the Databricks SDK
-            logger.info(f"Authenticating with Databricks at {self.workspace_url}")
+            logger.info("Authenticating with Databricks at %s", self.workspace_url)
 
             if not self.workspace_url or not self.token:
                 logger.error("Missing Databricks workspace URL or token")
@@ -35,246 +264,63 @@ class DatabricksIntegration(Integration):
             return True
 
         except Exception as e:
-            logger.error(f"Failed to authenticate with Databricks: {e}")
+            logger.error("Failed to authenticate with Databricks: %s", e)
             return False
 
-    def get_workload_data(self) -> List[Dict[str, Any]]:
+    def get_workload_data(self, copy: bool = False) -> List[Dict[str, Any]]:
         """Get job execution data from Databricks"""
         if not self._authenticated:
             self.authenticate()
 
         # Stub implementation - would use Databricks Jobs API
-        return [
-            {
-                "job_id": 12345,
-                "job_name": "daily_etl_pipeline",
-                "run_id": 67890,
-                "start_time": "2024-12-01T03:00:00Z",
-                "end_time": "2024-12-01T05:45:00Z",
-                "duration_minutes": 165,
-                "state": "SUCCESS",
-                "cluster_id": "0801-123456-abc123",
-                "cluster_spec": {
-                    "node_type_id": "i3.xlarge",
-                    "num_workers": 6,
-                    "driver_node_type_id": "i3.xlarge",
-                    "spark_version": "13.3.x-scala2.12",
-                },
-                "resource_usage": {
-                    "dbu_hours": 28.5,
-                    "compute_cost": 142.50,
-                    "total_cost": 156.75,
-                },
-                "notebook_path": "/Workflows/ETL/daily_processing",
-            },
-            {
-                "job_id": 54321,
-                "job_name": "ml_feature_engineering",
-                "run_id": 98765,
-                "start_time": "2024-12-01T10:00:00Z",
-                "end_time": "2024-12-01T11:30:00Z",
-                "duration_minutes": 90,
-                "state": "SUCCESS",
-                "cluster_id": "0801-987654-def456",
-                "cluster_spec": {
-                    "node_type_id": "r5d.2xlarge",
-                    "num_workers": 4,
-                    "driver_node_type_id": "r5d.xlarge",
-                    "spark_version": "13.3.x-scala2.12",
-                },
-                "resource_usage": {
-                    "dbu_hours": 16.5,
-                    "compute_cost": 82.50,
-                    "total_cost": 90.75,
-                },
-                "notebook_path": "/ML/feature_engineering",
-            },
-        ]
-
-    def get_resource_usage(self) -> Dict[str, Any]:
+        return deepcopy(_WORKLOAD_DATA) if copy else _WORKLOAD_DATA
+
+    def get_resource_usage(self, copy: bool = False) -> Dict[str, Any]:
         """Get cluster utilization data from Databricks"""
         if not self._authenticated:
             self.authenticate()
 
         # Stub implementation
-        return {
-            "clusters": [
-                {
-                    "cluster_id": "0801-123456-abc123",
-                    "cluster_name": "etl-production",
-                    "cluster_source": "JOB",
-                    "state": "TERMINATED",
-                    "node_type_id": "i3.xlarge",
-                    "num_workers": 6,
-                    "avg_cpu_utilization": 72.3,
-                    "avg_memory_utilization": 68.9,
-                    "uptime_hours": 168,  # 7 days
-                    "idle_time_hours": 42,  # 25% idle
-                    "total_dbu_hours": 336.0,
-                    "total_cost": 1680.00,
-                    "autoscaling": {"min_workers": 2, "max_workers": 8},
-                },
-                {
-                    "cluster_id": "0801-987654-def456",
-                    "cluster_name": "ml-experimentation",
-                    "cluster_source": "UI",
-                    "state": "RUNNING",
-                    "node_type_id": "r5d.2xlarge",
-                    "num_workers": 4,
-                    "avg_cpu_utilization": 45.6,
-                    "avg_memory_utilization": 52.1,
-                    "uptime_hours": 120,  # 5 days
-                    "idle_time_hours": 36,  # 30% idle
-                    "total_dbu_hours": 240.0,
-                    "total_cost": 1200.00,
-                    "autoscaling": {"min_workers": 1, "max_workers": 6},
-                },
-            ],
-            "summary": {
-                "total_clusters": 2,
-                "total_dbu_hours": 576.0,
-                "total_cost": 2880.00,
-                "avg_utilization": 58.9,
-                "idle_time_percent": 27.5,
-            },
-        }
+        return deepcopy(_RESOURCE_USAGE) if copy else _RESOURCE_USAGE
 
     def apply_recommendations(self, recommendations: List[Dict[str, Any]]) -> bool:
         """Apply optimization recommendations to Databricks clusters"""
         if not self._authenticated:
             self.authenticate()
 
-        logger.info(f"Applying {len(recommendations)} recommendations to Databricks")
+        logger.info("Applying %d recommendations to Databricks", len(recommendations))
 
+        # Group by type so each handler gets its whole batch in one call (one API
+        # request per group rather than per recommendation)
+        groups: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
         for rec in recommendations:
-            rec_type = rec.get("type", "unknown")
-            cluster_id = rec.get("cluster_id", "")
-
-            if rec_type == "rightsizing":
-                # Simulate cluster rightsizing
-                current_node_type = rec.get("current_node_type", "")
-                recommended_node_type = rec.get("recommended_node_type", "")
-                logger.info(
-                    f"Rightsizing cluster {cluster_id}: {current_node_type} -> {recommended_node_type}"
-                )
-
-            elif rec_type == "autoscaling":
-                # Simulate autoscaling optimization
-                min_workers = rec.get("recommended_min_workers", 1)
-                max_workers = rec.get("recommended_max_workers", 5)
-                logger.info(
-                    f"Updating autoscaling for {cluster_id}: {min_workers}-{max_workers} workers"
-                )
-
-            elif rec_type == "terminate_idle":
-                # Simulate idle cluster termination
-                logger.info(f"Terminating idle cluster {cluster_id}")
-
-            elif rec_type == "spot_instances":
-                # Simulate spot instance configuration
-                logger.info(f"Enabling spot instances for cluster {cluster_id}")
+            groups[rec.get("type", "unknown")].append(rec)
+
+        handlers = self._HANDLERS
+        for rec_type, batch in groups.items():
+            handler = handlers.get(rec_type)
+            if handler is not None:
+                handler(batch)
 
         return True
 
-    def get_jobs(self) -> List[Dict[str, Any]]:
+    def get_jobs(self, copy: bool = False) -> List[Dict[str, Any]]:
         """Get Databricks jobs and their configurations"""
         if not self._authenticated:
             self.authenticate()
 
-        return [
-            {
-                "job_id": 12345,
-                "job_name": "daily_etl_pipeline",
-                "schedule": "0 3 * * *",  # Daily at 3 AM
-                "timeout_seconds": 21600,  # 6 hours
-                "max_concurrent_runs": 1,
-                "cluster_spec": {
-                    "new_cluster": {
-                        "node_type_id": "i3.xlarge",
-                        "num_workers": 6,
-                        "spark_version": "13.3.x-scala2.12",
-                    }
-                },
-                "notebook_task": {"notebook_path": "/Workflows/ETL/daily_processing"},
-                "avg_runtime_minutes": 165,
-                "success_rate": 0.97,
-                "monthly_cost": 1250.00,
-            },
-            {
-                "job_id": 54321,
-                "job_name": "ml_feature_engineering",
-                "schedule": None,  # Manual trigger
-                "timeout_seconds": 7200,  # 2 hours
-                "max_concurrent_runs": 3,
-                "cluster_spec": {"existing_cluster_id": "0801-987654-def456"},
-                "notebook_task": {"notebook_path": "/ML/feature_engineering"},
-                "avg_runtime_minutes": 90,
-                "success_rate": 0.94,
-                "monthly_cost": 560.00,
-            },
-        ]
-
-    def get_notebooks(self) -> List[Dict[str, Any]]:
+        return deepcopy(_JOBS) if copy else _JOBS
+
+    def get_notebooks(self, copy: bool = False) -> List[Dict[str, Any]]:
         """Get Databricks notebooks and their usage patterns"""
         if not self._authenticated:
             self.authenticate()
 
-        return [
-            {
-                "path": "/Workflows/ETL/daily_processing",
-                "language": "python",
-                "last_modified": "2024-11-28T15:30:00Z",
-                "execution_count": 30,
-                "avg_execution_time": 165,
-                "resource_profile": "compute_intensive",
-                "associated_jobs": [12345],
-            },
-            {
-                "path": "/ML/feature_engineering",
-                "language": "python",
-                "last_modified": "2024-11-30T09:15:00Z",
-                "execution_count": 15,
-                "avg_execution_time": 90,
-                "resource_profile": "memory_intensive",
-                "associated_jobs": [54321],
-            },
-            {
-                "path": "/Analytics/exploratory_analysis",
-                "language": "sql",
-                "last_modified": "2024-12-01T11:00:00Z",
-                "execution_count": 8,
-                "avg_execution_time": 45,
-                "resource_profile": "interactive",
-                "associated_jobs": [],
-            },
-        ]
-
-    def get_workspace_usage(self) -> Dict[str, Any]:
+        return deepcopy(_NOTEBOOKS) if copy else _NOTEBOOKS
+
+    def get_workspace_usage(self, copy: bool = False) -> Dict[str, Any]:
         """Get overall workspace usage statistics"""
         if not self._authenticated:
             self.authenticate()
 
-        return {
-            "workspace_id": "1234567890123456",
-            "region": "us-east-1",
-            "pricing_tier": "PREMIUM",
-            "monthly_statistics": {
-                "total_dbu_hours": 2880.0,
-                "compute_cost": 14400.00,
-                "storage_cost": 125.50,
-                "total_cost": 14525.50,
-                "job_runs": 145,
-                "interactive_clusters": 8,
-                "automated_clusters": 12,
-            },
-            "cost_breakdown": {
-                "jobs": 12650.00,
-                "interactive": 1875.50,
-                "storage": 125.50,
-            },
-            "optimization_opportunities": {
-                "idle_clusters": 3,
-                "oversized_clusters": 2,
-                "potential_savings": 1850.75,
-            },
-        }
+        return deepcopy(_WORKSPACE_USAGE) if copy else _WORKSPACE_USAGE
@@ -3,16 +3,187 @@ Dataiku DSS Integration
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+from collections import defaultdict
+from copy import deepcopy
+from typing import Any, Callable, Dict, List, Optional
 
 from .base import Integration
 
 logger = logging.getLogger(__name__)
 
+# Stub payloads are built once at import and shared between calls; callers that
+# need to mutate the result pass copy=True to get a private deep copy
+_WORKLOAD_DATA = [
+    {
+        "job_id": "JOB_20241201_001",
+        "project_key": "ANALYTICS",
+        "scenario": "daily_batch_processing",
+        "start_time": "2024-12-01T02:00:00Z",
+        "end_time": "2024-12-01T04:30:00Z",
+        "duration_minutes": 150,
+        "status": "SUCCESS",
+        "resource_usage": {
+            "cluster_id": "cluster-spark-prod",
+            "node_count": 8,
+            "node_type": "m5.2xlarge",
+            "cpu_hours": 20.0,
+            "memory_gb_hours": 640.0,
+        },
+        "cost": 45.60,
+    },
+    {
+        "job_id": "JOB_20241201_002",
+        "project_key": "ML_TRAINING",
+        "scenario": "model_training_pipeline",
+        "start_time": "2024-12-01T08:00:00Z",
+        "end_time": "2024-12-01T12:15:00Z",
+        "duration_minutes": 255,
+        "status": "SUCCESS",
+        "resource_usage": {
+            "cluster_id": "cluster-gpu-ml",
+            "node_count": 4,
+            "node_type": "p3.2xlarge",
+            "cpu_hours": 17.0,
+            "memory_gb_hours": 244.0,
+            "gpu_hours": 17.0,
+        },
+        "cost": 89.25,
+    },
+]
+
+_RESOURCE_USAGE = {
+    "clusters": [
+        {
+            "cluster_id": "cluster-spark-prod",
+            "cluster_type": "spark",
+            "provider": "aws",
+            "avg_cpu_utilization": 65.2,
+            "avg_memory_utilization": 78.5,
+            "uptime_hours": 720,  # 30 days
+            "idle_time_hours": 180,  # 25% idle
+            "total_cost": 1250.75,
+            "node_type": "m5.2xlarge",
+            "min_nodes": 2,
+            "max_nodes": 10,
+            "avg_nodes": 6.5,
+        },
+        {
+            "cluster_id": "cluster-gpu-ml",
+            "cluster_type": "kubernetes",
+            "provider": "aws",
+            "avg_cpu_utilization": 45.8,
+            "avg_memory_utilization": 52.3,
+            "avg_gpu_utilization": 68.9,
+            "uptime_hours": 240,  # 10 days
+            "idle_time_hours": 48,  # 20% idle
+            "total_cost": 890.50,
+            "node_type": "p3.2xlarge",
+            "min_nodes": 1,
+            "max_nodes": 6,
+            "avg_nodes": 3.2,
+        },
+    ],
+    "summary": {
+        "total_clusters": 2,
+        "total_cost": 2141.25,
+        "avg_utilization": 56.5,
+        "optimization_potential": 25.3,
+    },
+}
+
+_PROJECT_INFO = {
+    "projects": [
+        {
+            "project_key": "ANALYTICS",
+            "name": "Business Analytics",
+            "description": "Daily business reporting and analytics",
+            "compute_clusters": ["cluster-spark-prod"],
+            "monthly_cost": 850.25,
+            "job_count": 45,
+            "avg_job_duration": 25,
+        },
+        {
+            "project_key": "ML_TRAINING",
+            "name": "Machine Learning Training",
+            "description": "Model training and experimentation",
+            "compute_clusters": ["cluster-gpu-ml"],
+            "monthly_cost": 1291.00,
+            "job_count": 12,
+            "avg_job_duration": 180,
+        },
+    ]
+}
+
+_SCENARIOS = [
+    {
+        "scenario_id": "daily_batch_processing",
+        "project_key": "ANALYTICS",
+        "name": "Daily Batch Processing",
+        "schedule": "0 2 * * *",  # Daily at 2 AM
+        "avg_duration": 150,
+        "success_rate": 0.98,
+        "resource_requirements": {
+            "cluster_type": "spark",
+            "min_nodes": 4,
+            "max_nodes": 8,
+        },
+    },
+    {
+        "scenario_id": "model_training_pipeline",
+        "project_key": "ML_TRAINING",
+        "name": "Model Training Pipeline",
+        "schedule": "manual",
+        "avg_duration": 255,
+        "success_rate": 0.95,
+        "resource_requirements": {
+            "cluster_type": "kubernetes",
+            "gpu_required": True,
+            "min_nodes": 2,
+            "max_nodes": 6,
+        },
+    },
+]
+
+
+def _apply_rightsizing(recs: List[Dict[str, Any]]) -> None:
+    # Simulate cluster rightsizing (one log line per batch)
+    if logger.isEnabledFor(logging.INFO):
+        changes = ", ".join(
+            f"{r.get('cluster_id', '')} ({r.get('current_node_type', '')}"
+            f" -> {r.get('recommended_node_type', '')})"
+            for r in recs
+        )
+        logger.info("Rightsizing %d cluster(s): %s", len(recs), changes)
+
+
+def _apply_auto_scaling(recs: List[Dict[str, Any]]) -> None:
+    # Simulate auto-scaling configuration
+    if logger.isEnabledFor(logging.INFO):
+        changes = ", ".join(
+            f"{r.get('cluster_id', '')} ({r.get('recommended_min_nodes', 1)}"
+            f"-{r.get('recommended_max_nodes', 5)} nodes)"
+            for r in recs
+        )
+        logger.info("Updating auto-scaling for %d cluster(s): %s", len(recs), changes)
+
+
+def _apply_schedule_optimization(recs: List[Dict[str, Any]]) -> None:
+    # Simulate schedule optimization
+    if logger.isEnabledFor(logging.INFO):
+        ids = ", ".join(r.get("cluster_id", "") for r in recs)
+        logger.info("Optimizing schedule for %d cluster(s): %s", len(recs), ids)
+
 
 class DataikuIntegration(Integration):
     """Integration with Dataiku Data Science Studio"""
 
+    # Recommendation type -> handler; unknown types are skipped
+    _HANDLERS: Dict[str, Callable[[List[Dict[str, Any]]], None]] = {
+        "rightsizing": _apply_rightsizing,
+        "auto_scaling": _apply_auto_scaling,
+        "schedule_optimization": _apply_schedule_optimization,
+    }
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         super().__init__(config)
         self.url = self.config.get("url", "")
@@ -21,9 +192,13 @@ class DataikuIntegration(Integration):
 
     def authenticate(self) -> bool:
         """Authenticate with Dataiku DSS API"""
+        # Already authenticated: skip the auth flow and its logging
+        if self._authenticated:
+            return True
+
         try:
             # In a real implementation, this would use the Dataiku Python API client
-            logger.info(f"Authenticating with Dataiku at {self.url}")
+            logger.info("Authenticating with Dataiku at %s", self.url)
 
             if not self.url or not self.api_key:
                 logger.error("Missing Dataiku URL or API key")
@@ -35,191 +210,56 @@ class DataikuIntegration(Integration):
             return True
 
         except Exception as e:
-            logger.error(f"Failed to authenticate with Dataiku: {e}")
+            logger.error("Failed to authenticate with Dataiku: %s", e)
             return False
 
-    def get_workload_data(self) -> List[Dict[str, Any]]:
+    def get_workload_data(self, copy: bool = False) -> List[Dict[str, Any]]:
         """Get job execution data from Dataiku"""
         if not self._authenticated:
             self.authenticate()
 
         # Stub implementation - would use Dataiku API to get job data
-        return [
-            {
-                "job_id": "JOB_20241201_001",
-                "project_key": "ANALYTICS",
-                "scenario": "daily_batch_processing",
-                "start_time": "2024-12-01T02:00:00Z",
-                "end_time": "2024-12-01T04:30:00Z",
-                "duration_minutes": 150,
-                "status": "SUCCESS",
-                "resource_usage": {
-                    "cluster_id": "cluster-spark-prod",
-                    "node_count": 8,
-                    "node_type": "m5.2xlarge",
-                    "cpu_hours": 20.0,
-                    "memory_gb_hours": 640.0,
-                },
-                "cost": 45.60,
-            },
-            {
-                "job_id": "JOB_20241201_002",
-                "project_key": "ML_TRAINING",
-                "scenario": "model_training_pipeline",
-                "start_time": "2024-12-01T08:00:00Z",
-                "end_time": "2024-12-01T12:15:00Z",
-                "duration_minutes": 255,
-                "status": "SUCCESS",
-                "resource_usage": {
-                    "cluster_id": "cluster-gpu-ml",
-                    "node_count": 4,
-                    "node_type": "p3.2xlarge",
-                    "cpu_hours": 17.0,
-                    "memory_gb_hours": 244.0,
-                    "gpu_hours": 17.0,
-                },
-                "cost": 89.25,
-            },
-        ]
-
-    def get_resource_usage(self) -> Dict[str, Any]:
+        return deepcopy(_WORKLOAD_DATA) if copy else _WORKLOAD_DATA
+
+    def get_resource_usage(self, copy: bool = False) -> Dict[str, Any]:
         """Get resource utilization data from Dataiku clusters"""
         if not self._authenticated:
             self.authenticate()
 
         # Stub implementation
-        return {
-            "clusters": [
-                {
-                    "cluster_id": "cluster-spark-prod",
-                    "cluster_type": "spark",
-                    "provider": "aws",
-                    "avg_cpu_utilization": 65.2,
-                    "avg_memory_utilization": 78.5,
-                    "uptime_hours": 720,  # 30 days
-                    "idle_time_hours": 180,  # 25% idle
-                    "total_cost": 1250.75,
-                    "node_type": "m5.2xlarge",
-                    "min_nodes": 2,
-                    "max_nodes": 10,
-                    "avg_nodes": 6.5,
-                },
-                {
-                    "cluster_id": "cluster-gpu-ml",
-                    "cluster_type": "kubernetes",
-                    "provider": "aws",
-                    "avg_cpu_utilization": 45.8,
-                    "avg_memory_utilization": 52.3,
-                    "avg_gpu_utilization": 68.9,
-                    "uptime_hours": 240,  # 10 days
-                    "idle_time_hours": 48,  # 20% idle
-                    "total_cost": 890.50,
-                    "node_type": "p3.2xlarge",
-                    "min_nodes": 1,
-                    "max_nodes": 6,
-                    "avg_nodes": 3.2,
-                },
-            ],
-            "summary": {
-                "total_clusters": 2,
-                "total_cost": 2141.25,
-                "avg_utilization": 56.5,
-                "optimization_potential": 25.3,
-            },
-        }
+        return deepcopy(_RESOURCE_USAGE) if copy else _RESOURCE_USAGE
 
     def apply_recommendations(self, recommendations: List[Dict[str, Any]]) -> bool:
         """Apply optimization recommendations to Dataiku clusters"""
         if not self._authenticated:
             self.authenticate()
 
-        logger.info(f"Applying {len(recommendations)} recommendations to Dataiku")
+        logger.info("Applying %d recommendations to Dataiku", len(recommendations))
 
+        # Group by type so each handler gets its whole batch in one call (one API
+        # request per group rather than per recommendation)
+        groups: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
         for rec in recommendations:
-            rec_type = rec.get("type", "unknown")
-            cluster_id = rec.get("cluster_id", "")
-
-            if rec_type == "rightsizing":
-                # Simulate cluster rightsizing
-                current_type = rec.get("current_node_type", "")
-                recommended_type = rec.get("recommended_node_type", "")
-                logger.info(
-                    f"Rightsizing cluster {cluster_id}: {current_type} -> {recommended_type}"
-                )
-
-            elif rec_type == "auto_scaling":
-                # Simulate auto-scaling configuration
-                min_nodes = rec.get("recommended_min_nodes", 1)
-                max_nodes = rec.get("recommended_max_nodes", 5)
-                logger.info(
-                    f"Updating auto-scaling for {cluster_id}: {min_nodes}-{max_nodes} nodes"
-                )
-
-            elif rec_type == "schedule_optimization":
-                # Simulate schedule optimization
-                logger.info(f"Optimizing schedule for cluster {cluster_id}")
+            groups[rec.get("type", "unknown")].append(rec)
+
+        handlers = self._HANDLERS
+        for rec_type, batch in groups.items():
+            handler = handlers.get(rec_type)
+            if handler is not None:
+                handler(batch)
 
         return True
 
-    def get_project_info(self) -> Dict[str, Any]:
+    def get_project_info(self, copy: bool = False) -> Dict[str, Any]:
         """Get information about Dataiku projects"""
         if not self._authenticated:
             self.authenticate()
 
-        return {
-            "projects": [
-                {
-                    "project_key": "ANALYTICS",
-                    "name": "Business Analytics",
-                    "description": "Daily business reporting and analytics",
-                    "compute_clusters": ["cluster-spark-prod"],
-                    "monthly_cost": 850.25,
-                    "job_count": 45,
-                    "avg_job_duration": 25,
-                },
-                {
-                    "project_key": "ML_TRAINING",
-                    "name": "Machine Learning Training",
-                    "description": "Model training and experimentation",
-                    "compute_clusters": ["cluster-gpu-ml"],
-                    "monthly_cost": 1291.00,
-                    "job_count": 12,
-                    "avg_job_duration": 180,
-                },
-            ]
-        }
-
-    def get_scenarios(self) -> List[Dict[str, Any]]:
+        return deepcopy(_PROJECT_INFO) if copy else _PROJECT_INFO
+
+    def get_scenarios(self, copy: bool = False) -> List[Dict[str, Any]]:
         """Get Dataiku scenarios and their execution patterns"""
         if not self._authenticated:
             self.authenticate()
 
-        return [
-            {
-                "scenario_id": "daily_batch_processing",
-                "project_key": "ANALYTICS",
-                "name": "Daily Batch Processing",
-                "schedule": "0 2 * * *",  # Daily at 2 AM
-                "avg_duration": 150,
-                "success_rate": 0.98,
-                "resource_requirements": {
-                    "cluster_type": "spark",
-                    "min_nodes": 4,
-                    "max_nodes": 8,
-                },
-            },
-            {
-                "scenario_id": "model_training_pipeline",
-                "project_key": "ML_TRAINING",
-                "name": "Model Training Pipeline",
-                "schedule": "manual",
-                "avg_duration": 255,
-                "success_rate": 0.95,
-                "resource_requirements": {
-                    "cluster_type": "kubernetes",
-                    "gpu_required": True,
-                    "min_nodes": 2,
-                    "max_nodes": 6,
-                },
-            },
-        ]
+        return deepcopy(_SCENARIOS) if copy else _SCENARIOS
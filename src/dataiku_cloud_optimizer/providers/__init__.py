@@ -1,7 +1,19 @@
 """Cloud providers module"""
 
-from .aws import AWSProvider
-from .azure import AzureProvider
-from .gcp import GCPProvider
+import importlib
+from typing import Any
+
+# Imported on first attribute access, so using one provider (or only .base, as core
+# does) does not load the others and their cloud SDKs
+_LAZY = {"AWSProvider": ".aws", "AzureProvider": ".azure", "GCPProvider": ".gcp"}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = ["AWSProvider", "AzureProvider", "GCPProvider"]
@@ -3,12 +3,91 @@ Azure Cloud Provider implementation
 """
 
 import logging
+from copy import deepcopy
 from typing import Any, Dict, List, Optional
 
 from .base import CloudProvider
 
 logger = logging.getLogger(__name__)
 
+# Stub payloads are built once at import and shared between calls; callers that
+# need to mutate the result pass copy=True to get a private deep copy
+_RESOURCE_INVENTORY = [
+    {
+        "resource_id": "/subscriptions/sub-id/resourceGroups/rg-prod/providers/Microsoft.Compute/virtualMachines/vm-web-01",
+        "resource_type": "Virtual Machine",
+        "vm_size": "Standard_D2s_v3",
+        "state": "running",
+        "cost_per_hour": 0.096,
+        "cpu_utilization": 35.2,
+        "tags": {"Environment": "production", "Application": "web"},
+    },
+    {
+        "resource_id": "/subscriptions/sub-id/resourceGroups/rg-prod/providers/Microsoft.Sql/servers/sql-prod/databases/analytics-db",
+        "resource_type": "SQL Database",
+        "service_tier": "Standard",
+        "compute_size": "S2",
+        "state": "online",
+        "cost_per_hour": 0.045,
+        "dtu_utilization": 28.5,
+    },
+]
+
+_RECOMMENDATIONS = [
+    {
+        "type": "rightsizing",
+        "resource_id": "/subscriptions/sub-id/resourceGroups/rg-prod/providers/Microsoft.Compute/virtualMachines/vm-web-01",
+        "current_size": "Standard_D2s_v3",
+        "recommended_size": "Standard_B2s",
+        "estimated_savings": 38.40,
+        "confidence": 0.80,
+        "reason": "Consistent low CPU and memory utilization",
+    },
+    {
+        "type": "reserved_instance",
+        "resource_type": "Virtual Machine",
+        "instances_count": 5,
+        "estimated_savings": 156.00,
+        "confidence": 0.90,
+        "reason": "Consistent usage pattern suitable for reservations",
+    },
+]
+
+_RIGHTSIZING_OPPORTUNITIES = [
+    {
+        "vm_name": "vm-web-01",
+        "resource_id": "/subscriptions/sub-id/resourceGroups/rg-prod/providers/Microsoft.Compute/virtualMachines/vm-web-01",
+        "current_size": "Standard_D2s_v3",
+        "recommended_size": "Standard_B2s",
+        "cpu_utilization": 35.2,
+        "memory_utilization": 42.1,
+        "network_utilization": 18.5,
+        "monthly_savings": 38.40,
+        "confidence_score": 0.80,
+    }
+]
+
+_UNUSED_RESOURCES = [
+    {
+        "resource_id": "/subscriptions/sub-id/resourceGroups/rg-test/providers/Microsoft.Compute/disks/disk-unused-01",
+        "resource_type": "Managed Disk",
+        "size_gb": 128,
+        "disk_type": "Premium_LRS",
+        "status": "unattached",
+        "monthly_cost": 19.20,
+        "last_attached": None,
+        "recommendation": "Delete unattached managed disk",
+    },
+    {
+        "resource_id": "/subscriptions/sub-id/resourceGroups/rg-old/providers/Microsoft.Network/publicIPAddresses/pip-old-01",
+        "resource_type": "Public IP",
+        "allocation": "static",
+        "status": "unassigned",
+        "monthly_cost": 3.60,
+        "recommendation": "Release unassigned public IP",
+    },
+]
+
 
 class AzureProvider(CloudProvider):
     """Azure Cloud Provider for cost optimization"""
@@ -21,15 +100,19 @@ class AzureProvider(CloudProvider):
 
     def authenticate(self) -> bool:
         """Authenticate with Azure using Azure Identity"""
+        # Already authenticated: skip the auth flow and its logging
+        if self._authenticated:
+            return True
+
         try:
             # In a real implementation, this would use azure-identity
             logger.info(
-                f"Authenticating with Azure subscription: {self.subscription_id}"
+                "Authenticating with Azure subscription: %s", self.subscription_id
             )
             self._authenticated = True
             return True
         except Exception as e:
-            logger.error(f"Failed to authenticate with Azure: {e}")
+            logger.error("Failed to authenticate with Azure: %s", e)
             return False
 
     def get_cost_data(
@@ -56,100 +139,34 @@ class AzureProvider(CloudProvider):
             "resource_groups": {"rg-production": 750.00, "rg-development": 230.25},
         }
 
-    def get_resource_inventory(self) -> List[Dict[str, Any]]:
+    def get_resource_inventory(self, copy: bool = False) -> List[Dict[str, Any]]:
         """Get Azure resource inventory"""
         if not self._authenticated:
             self.authenticate()
 
         # Stub implementation
-        return [
-            {
-                "resource_id": "/subscriptions/sub-id/resourceGroups/rg-prod/providers/Microsoft.Compute/virtualMachines/vm-web-01",
-                "resource_type": "Virtual Machine",
-                "vm_size": "Standard_D2s_v3",
-                "state": "running",
-                "cost_per_hour": 0.096,
-                "cpu_utilization": 35.2,
-                "tags": {"Environment": "production", "Application": "web"},
-            },
-            {
-                "resource_id": "/subscriptions/sub-id/resourceGroups/rg-prod/providers/Microsoft.Sql/servers/sql-prod/databases/analytics-db",
-                "resource_type": "SQL Database",
-                "service_tier": "Standard",
-                "compute_size": "S2",
-                "state": "online",
-                "cost_per_hour": 0.045,
-                "dtu_utilization": 28.5,
-            },
-        ]
+        return deepcopy(_RESOURCE_INVENTORY) if copy else _RESOURCE_INVENTORY
 
-    def get_recommendations(self) -> List[Dict[str, Any]]:
+    def get_recommendations(self, copy: bool = False) -> List[Dict[str, Any]]:
         """Get Azure-specific optimization recommendations"""
         if not self._authenticated:
             self.authenticate()
 
         # Stub implementation using Azure Advisor style recommendations
-        return [
-            {
-                "type": "rightsizing",
-                "resource_id": "/subscriptions/sub-id/resourceGroups/rg-prod/providers/Microsoft.Compute/virtualMachines/vm-web-01",
-                "current_size": "Standard_D2s_v3",
-                "recommended_size": "Standard_B2s",
-                "estimated_savings": 38.40,
-                "confidence": 0.80,
-                "reason": "Consistent low CPU and memory utilization",
-            },
-            {
-                "type": "reserved_instance",
-                "resource_type": "Virtual Machine",
-                "instances_count": 5,
-                "estimated_savings": 156.00,
-                "confidence": 0.90,
-                "reason": "Consistent usage pattern suitable for reservations",
-            },
-        ]
+        return deepcopy(_RECOMMENDATIONS) if copy else _RECOMMENDATIONS
 
-    def get_rightsizing_opportunities(self) -> List[Dict[str, Any]]:
+    def get_rightsizing_opportunities(self, copy: bool = False) -> List[Dict[str, Any]]:
         """Get VM rightsizing opportunities"""
         if not self._authenticated:
             self.authenticate()
 
-        return [
-            {
-                "vm_name": "vm-web-01",
-                "resource_id": "/subscriptions/sub-id/resourceGroups/rg-prod/providers/Microsoft.Compute/virtualMachines/vm-web-01",
-                "current_size": "Standard_D2s_v3",
-                "recommended_size": "Standard_B2s",
-                "cpu_utilization": 35.2,
-                "memory_utilization": 42.1,
-                "network_utilization": 18.5,
-                "monthly_savings": 38.40,
-                "confidence_score": 0.80,
-            }
-        ]
-
-    def get_unused_resources(self) -> List[Dict[str, Any]]:
+        return (
+            deepcopy(_RIGHTSIZING_OPPORTUNITIES) if copy else _RIGHTSIZING_OPPORTUNITIES
+        )
+
+    def get_unused_resources(self, copy: bool = False) -> List[Dict[str, Any]]:
         """Get unused Azure resources"""
         if not self._authenticated:
             self.authenticate()
 
-        return [
-            {
-                "resource_id": "/subscriptions/sub-id/resourceGroups/rg-test/providers/Microsoft.Compute/disks/disk-unused-01",
-                "resource_type": "Managed Disk",
-                "size_gb": 128,
-                "disk_type": "Premium_LRS",
-                "status": "unattached",
-                "monthly_cost": 19.20,
-                "last_attached": None,
-                "recommendation": "Delete unattached managed disk",
-            },
-            {
-                "resource_id": "/subscriptions/sub-id/resourceGroups/rg-old/providers/Microsoft.Network/publicIPAddresses/pip-old-01",
-                "resource_type": "Public IP",
-                "allocation": "static",
-                "status": "unassigned",
-                "monthly_cost": 3.60,
-                "recommendation": "Release unassigned public IP",
-            },
-        ]
+        return deepcopy(_UNUSED_RESOURCES) if copy else _UNUSED_RESOURCES
@@ -6,6 +6,8 @@ from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 
+from ..utils.dates import parse_day
+
 
 class CloudProvider(ABC):
     """Abstract base class for cloud providers"""
@@ -55,8 +57,6 @@ class CloudProvider(ABC):
     def validate_date_range(self, start_date: str, end_date: str) -> bool:
         """Validate date range format and logic"""
         try:
-            start = datetime.strptime(start_date, "%Y-%m-%d")
-            end = datetime.strptime(end_date, "%Y-%m-%d")
-            return start <= end
+            return parse_day(start_date) <= parse_day(end_date)
         except ValueError:
             return False
@@ -3,12 +3,110 @@ Google Cloud Platform Provider implementation
 """
 
 import logging
+from copy import deepcopy
 from typing import Any, Dict, List, Optional
 
 from .base import CloudProvider
 
 logger = logging.getLogger(__name__)
 
+# Stub payloads are built once at import and shared between calls; callers that
+# need to mutate the result pass copy=True to get a private deep copy
+_RESOURCE_INVENTORY = [
+    {
+        "resource_id": "projects/my-project/zones/us-central1-a/instances/instance-1",
+        "resource_type": "Compute Engine",
+        "machine_type": "n1-standard-2",
+        "status": "RUNNING",
+        "cost_per_hour": 0.095,
+        "cpu_utilization": 28.7,
+        "labels": {"environment": "production", "team": "analytics"},
+    },
+    {
+        "resource_id": "projects/my-project/instances/db-instance-1",
+        "resource_type": "Cloud SQL",
+        "tier": "db-n1-standard-1",
+        "status": "RUNNABLE",
+        "cost_per_hour": 0.055,
+        "cpu_utilization": 40.3,
+        "labels": {"environment": "production", "service": "api"},
+    },
+]
+
+_RECOMMENDATIONS = [
+    {
+        "type": "rightsizing",
+        "resource_id": "projects/my-project/zones/us-central1-a/instances/instance-1",
+        "current_type": "n1-standard-2",
+        "recommended_type": "n1-standard-1",
+        "estimated_savings": 42.75,
+        "confidence": 0.88,
+        "reason": "Sustained low CPU utilization and memory usage",
+    },
+    {
+        "type": "committed_use_discount",
+        "resource_type": "Compute Engine",
+        "instances_count": 8,
+        "estimated_savings": 180.50,
+        "confidence": 0.95,
+        "reason": "Consistent usage pattern over 3 months",
+    },
+]
+
+_RIGHTSIZING_OPPORTUNITIES = [
+    {
+        "instance_name": "instance-1",
+        "resource_id": "projects/my-project/zones/us-central1-a/instances/instance-1",
+        "current_type": "n1-standard-2",
+        "recommended_type": "n1-standard-1",
+        "cpu_utilization": 28.7,
+        "memory_utilization": 32.4,
+        "network_utilization": 12.8,
+        "monthly_savings": 42.75,
+        "confidence_score": 0.88,
+    },
+    {
+        "instance_name": "analytics-worker",
+        "resource_id": "projects/my-project/zones/us-central1-b/instances/analytics-worker",
+        "current_type": "n1-highmem-4",
+        "recommended_type": "n1-standard-4",
+        "cpu_utilization": 65.2,
+        "memory_utilization": 35.1,
+        "network_utilization": 22.5,
+        "monthly_savings": 85.20,
+        "confidence_score": 0.82,
+    },
+]
+
+_UNUSED_RESOURCES = [
+    {
+        "resource_id": "projects/my-project/zones/us-central1-a/disks/disk-unused-1",
+        "resource_type": "Persistent Disk",
+        "size_gb": 200,
+        "disk_type": "pd-ssd",
+        "status": "unattached",
+        "monthly_cost": 34.00,
+        "last_attached": None,
+        "recommendation": "Delete unattached persistent disk",
+    },
+    {
+        "resource_id": "projects/my-project/global/addresses/address-unused-1",
+        "resource_type": "Static IP",
+        "region": "global",
+        "status": "reserved",
+        "monthly_cost": 7.30,
+        "recommendation": "Release unused static IP address",
+    },
+    {
+        "resource_id": "projects/my-project/global/images/old-image-20230101",
+        "resource_type": "Compute Image",
+        "size_gb": 10,
+        "age_days": 150,
+        "monthly_cost": 2.50,
+        "recommendation": "Delete old custom image",
+    },
+]
+
 
 class GCPProvider(CloudProvider):
     """Google Cloud Platform Provider for cost optimization"""
@@ -21,13 +119,17 @@ class GCPProvider(CloudProvider):
 
     def authenticate(self) -> bool:
         """Authenticate with GCP using service account or application default credentials"""
+        # Already authenticated: skip the auth flow and its logging
+        if self._authenticated:
+            return True
+
         try:
             # In a real implementation, this would use google-cloud libraries
-            logger.info(f"Authenticating with GCP project: {self.project_id}")
+            logger.info("Authenticating with GCP project: %s", self.project_id)
             self._authenticated = True
             return True
         except Exception as e:
-            logger.error(f"Failed to authenticate with GCP: {e}")
+            logger.error("Failed to authenticate with GCP: %s", e)
             return False
 
     def get_cost_data(
@@ -59,119 +161,34 @@ class GCPProvider(CloudProvider):
             },
         }
 
-    def get_resource_inventory(self) -> List[Dict[str, Any]]:
+    def get_resource_inventory(self, copy: bool = False) -> List[Dict[str, Any]]:
         """Get GCP resource inventory"""
         if not self._authenticated:
             self.authenticate()
 
         # Stub implementation
-        return [
-            {
-                "resource_id": "projects/my-project/zones/us-central1-a/instances/instance-1",
-                "resource_type": "Compute Engine",
-                "machine_type": "n1-standard-2",
-                "status": "RUNNING",
-                "cost_per_hour": 0.095,
-                "cpu_utilization": 28.7,
-                "labels": {"environment": "production", "team": "analytics"},
-            },
-            {
-                "resource_id": "projects/my-project/instances/db-instance-1",
-                "resource_type": "Cloud SQL",
-                "tier": "db-n1-standard-1",
-                "status": "RUNNABLE",
-                "cost_per_hour": 0.055,
-                "cpu_utilization": 40.3,
-                "labels": {"environment": "production", "service": "api"},
-            },
-        ]
+        return deepcopy(_RESOURCE_INVENTORY) if copy else _RESOURCE_INVENTORY
 
-    def get_recommendations(self) -> List[Dict[str, Any]]:
+    def get_recommendations(self, copy: bool = False) -> List[Dict[str, Any]]:
         """Get GCP-specific optimization recommendations"""
         if not self._authenticated:
             self.authenticate()
 
         # Stub implementation using GCP Recommender style recommendations
-        return [
-            {
-                "type": "rightsizing",
-                "resource_id": "projects/my-project/zones/us-central1-a/instances/instance-1",
-                "current_type": "n1-standard-2",
-                "recommended_type": "n1-standard-1",
-                "estimated_savings": 42.75,
-                "confidence": 0.88,
-                "reason": "Sustained low CPU utilization and memory usage",
-            },
-            {
-                "type": "committed_use_discount",
-                "resource_type": "Compute Engine",
-                "instances_count": 8,
-                "estimated_savings": 180.50,
-                "confidence": 0.95,
-                "reason": "Consistent usage pattern over 3 months",
-            },
-        ]
+        return deepcopy(_RECOMMENDATIONS) if copy else _RECOMMENDATIONS
 
-    def get_rightsizing_opportunities(self) -> List[Dict[str, Any]]:
+    def get_rightsizing_opportunities(self, copy: bool = False) -> List[Dict[str, Any]]:
         """Get Compute Engine rightsizing opportunities"""
         if not self._authenticated:
             self.authenticate()
 
-        return [
-            {
-                "instance_name": "instance-1",
-                "resource_id": "projects/my-project/zones/us-central1-a/instances/instance-1",
-                "current_type": "n1-standard-2",
-                "recommended_type": "n1-standard-1",
-                "cpu_utilization": 28.7,
-                "memory_utilization": 32.4,
-                "network_utilization": 12.8,
-                "monthly_savings": 42.75,
-                "confidence_score": 0.88,
-            },
-            {
-                "instance_name": "analytics-worker",
-                "resource_id": "projects/my-project/zones/us-central1-b/instances/analytics-worker",
-                "current_type": "n1-highmem-4",
-                "recommended_type": "n1-standard-4",
-                "cpu_utilization": 65.2,
-                "memory_utilization": 35.1,
-                "network_utilization": 22.5,
-                "monthly_savings": 85.20,
-                "confidence_score": 0.82,
-            },
-        ]
+        return (
+            deepcopy(_RIGHTSIZING_OPPORTUNITIES) if copy else _RIGHTSIZING_OPPORTUNITIES
+        )
 
-    def get_unused_resources(self) -> List[Dict[str, Any]]:
+    def get_unused_resources(self, copy: bool = False) -> List[Dict[str, Any]]:
         """Get unused GCP resources"""
         if not self._authenticated:
             self.authenticate()
 
-        return [
-            {
-                "resource_id": "projects/my-project/zones/us-central1-a/disks/disk-unused-1",
-                "resource_type": "Persistent Disk",
-                "size_gb": 200,
-                "disk_type": "pd-ssd",
-                "status": "unattached",
-                "monthly_cost": 34.00,
-                "last_attached": None,
-                "recommendation": "Delete unattached persistent disk",
-            },
-            {
-                "resource_id": "projects/my-project/global/addresses/address-unused-1",
-                "resource_type": "Static IP",
-                "region": "global",
-                "status": "reserved",
-                "monthly_cost": 7.30,
-                "recommendation": "Release unused static IP address",
-            },
-            {
-                "resource_id": "projects/my-project/global/images/old-image-20230101",
-                "resource_type": "Compute Image",
-                "size_gb": 10,
-                "age_days": 150,
-                "monthly_cost": 2.50,
-                "recommendation": "Delete old custom image",
-            },
-        ]
+        return deepcopy(_UNUSED_RESOURCES) if copy else _UNUSED_RESOURCES
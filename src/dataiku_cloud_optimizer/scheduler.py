@@ -8,6 +8,9 @@ from apscheduler.schedulers.background import BackgroundScheduler
 
 from .core import CloudOptimizerAgent
 
+# Seconds a late run may still start (e.g. after a long cycle or a suspend)
+MISFIRE_GRACE_TIME = 300
+
 
 class AgentScheduler:
     def __init__(self, agent: CloudOptimizerAgent) -> None:
@@ -23,12 +26,16 @@ class AgentScheduler:
     ) -> None:
         if self._job:
             self._job.remove()
+        # A cycle that overruns the interval must not stack up concurrent runs:
+        # allow one instance and fold missed fire times into a single run
         self._job = self._sched.add_job(
-            lambda: self.agent.run_proactive_cycle(
-                provider=provider, channels=channels
-            ),
+            self.agent.run_proactive_cycle,
             "interval",
             minutes=interval_minutes,
+            kwargs={"provider": provider, "channels": channels},
+            coalesce=True,
+            max_instances=1,
+            misfire_grace_time=MISFIRE_GRACE_TIME,
             replace_existing=True,
             id="proactive-cycle",
         )
@@ -3,12 +3,53 @@ Cost optimization strategy implementation
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .base import OptimizationStrategy
 
 logger = logging.getLogger(__name__)
 
+# Generic recommendations as data, in output order:
+# (min total_cost, savings factor, savings cap or None, type, description, confidence, priority)
+_RULES: Tuple[Tuple[float, float, Optional[float], str, str, float, str], ...] = (
+    (
+        500,
+        0.15,  # ~15% of compute costs
+        None,
+        "rightsizing",
+        "Rightsize overprovisioned instances to save ~15% of compute costs",
+        0.8,
+        "high",
+    ),
+    (
+        200,
+        0.08,
+        150,  # Up to $150 in unused resources
+        "unused_resources",
+        "Remove unused storage volumes, snapshots, and IP addresses",
+        0.9,
+        "medium",
+    ),
+    (
+        800,
+        0.25,
+        None,
+        "reservations",
+        "Purchase reserved instances or committed use discounts for consistent workloads",
+        0.7,
+        "low",
+    ),
+    (
+        300,
+        0.05,
+        None,
+        "storage_optimization",
+        "Optimize storage classes and implement lifecycle policies",
+        0.75,
+        "medium",
+    ),
+)
+
 
 class CostOptimizationStrategy(OptimizationStrategy):
     """
@@ -24,7 +65,8 @@ class CostOptimizationStrategy(OptimizationStrategy):
     def optimize(self, cost_data: Dict[str, Any]) -> Dict[str, Any]:
         """Apply cost optimization strategy"""
         logger.info(
-            f"Applying cost optimization strategy to {cost_data.get('provider', 'unknown')} data"
+            "Applying cost optimization strategy to %s data",
+            cost_data.get("provider", "unknown"),
         )
 
         total_cost = cost_data.get("total_cost", 0.0)
@@ -32,8 +74,12 @@ class CostOptimizationStrategy(OptimizationStrategy):
         # Simulate optimization analysis
         recommendations = self._generate_recommendations(cost_data)
 
-        # Calculate potential savings
-        total_savings = sum(rec.get("savings", 0) for rec in recommendations)
+        # Total savings and descriptions in one pass (every rec carries "savings")
+        total_savings = 0.0
+        descriptions = []
+        for rec in recommendations:
+            total_savings += rec["savings"]
+            descriptions.append(rec["description"])
         optimized_cost = max(0, total_cost - total_savings)
 
         # Calculate confidence based on data quality and consistency
@@ -44,7 +90,7 @@ class CostOptimizationStrategy(OptimizationStrategy):
             "current_cost": total_cost,
             "optimized_cost": optimized_cost,
             "savings": total_savings,
-            "recommendations": [rec["description"] for rec in recommendations],
+            "recommendations": descriptions,
             "confidence_score": confidence,
             "detailed_recommendations": recommendations,
         }
@@ -57,76 +103,36 @@ class CostOptimizationStrategy(OptimizationStrategy):
         total_cost = cost_data.get("total_cost", 0.0)
         provider = cost_data.get("provider", "unknown")
 
-        # Rightsizing recommendation (simulate based on cost)
-        if total_cost > 500:
-            rightsizing_savings = total_cost * 0.15  # 15% potential savings
-            recommendations.append(
-                {
-                    "type": "rightsizing",
-                    "description": "Rightsize overprovisioned instances to save ~15% of compute costs",
-                    "savings": rightsizing_savings,
-                    "confidence": 0.8,
-                    "priority": "high",
-                }
-            )
-
-        # Unused resources recommendation
-        if total_cost > 200:
-            unused_savings = min(
-                total_cost * 0.08, 150
-            )  # Up to $150 in unused resources
-            recommendations.append(
-                {
-                    "type": "unused_resources",
-                    "description": "Remove unused storage volumes, snapshots, and IP addresses",
-                    "savings": unused_savings,
-                    "confidence": 0.9,
-                    "priority": "medium",
-                }
-            )
-
-        # Reserved instances/committed use discounts
-        if total_cost > 800:
-            reservation_savings = total_cost * 0.25  # 25% potential savings
-            recommendations.append(
-                {
-                    "type": "reservations",
-                    "description": "Purchase reserved instances or committed use discounts for consistent workloads",
-                    "savings": reservation_savings,
-                    "confidence": 0.7,
-                    "priority": "low",
-                }
-            )
-
-        # Storage optimization
-        if total_cost > 300:
-            storage_savings = total_cost * 0.05  # 5% storage optimization
-            recommendations.append(
-                {
-                    "type": "storage_optimization",
-                    "description": "Optimize storage classes and implement lifecycle policies",
-                    "savings": storage_savings,
-                    "confidence": 0.75,
-                    "priority": "medium",
-                }
-            )
+        min_savings = self.min_savings_threshold
+
+        # One pass over the rule table: build only recommendations that clear the threshold
+        for min_cost, factor, cap, rec_type, desc, conf, priority in _RULES:
+            if total_cost <= min_cost:
+                continue
+            savings = total_cost * factor
+            if cap is not None and savings > cap:
+                savings = cap
+            if savings >= min_savings:
+                recommendations.append(
+                    {
+                        "type": rec_type,
+                        "description": desc,
+                        "savings": savings,
+                        "confidence": conf,
+                        "priority": priority,
+                    }
+                )
 
         # Provider-specific recommendations
-        if provider == "aws":
-            recommendations.extend(self._get_aws_specific_recommendations(cost_data))
-        elif provider == "azure":
-            recommendations.extend(self._get_azure_specific_recommendations(cost_data))
-        elif provider == "gcp":
-            recommendations.extend(self._get_gcp_specific_recommendations(cost_data))
-
-        # Filter recommendations by minimum savings threshold
-        filtered_recs = [
-            rec
-            for rec in recommendations
-            if rec["savings"] >= self.min_savings_threshold
-        ]
+        handler = self._PROVIDER_DISPATCH.get(provider)
+        if handler is not None:
+            recommendations.extend(
+                rec
+                for rec in getattr(self, handler)(cost_data)
+                if rec["savings"] >= min_savings
+            )
 
-        return filtered_recs
+        return recommendations
 
     def _get_aws_specific_recommendations(
         self, cost_data: Dict[str, Any]
@@ -170,31 +176,38 @@ class CostOptimizationStrategy(OptimizationStrategy):
             }
         ]
 
+    # Provider name -> method name, resolved per call so subclass overrides apply
+    _PROVIDER_DISPATCH: Dict[str, str] = {
+        "aws": "_get_aws_specific_recommendations",
+        "azure": "_get_azure_specific_recommendations",
+        "gcp": "_get_gcp_specific_recommendations",
+    }
+
     def calculate_confidence(self, data: Dict[str, Any]) -> float:
         """Calculate confidence score based on data quality"""
-        confidence_factors = []
+        # Accumulate in place; factors are added in the same order as before
+        confidence = 0.0
 
         # Data completeness
         if data.get("total_cost", 0) > 0:
-            confidence_factors.append(0.3)
+            confidence += 0.3
 
         # Resource count indicates data richness
         resource_count = data.get("resource_count", 0)
         if resource_count > 10:
-            confidence_factors.append(0.2)
+            confidence += 0.2
         elif resource_count > 0:
-            confidence_factors.append(0.1)
+            confidence += 0.1
 
         # Service breakdown available
         if data.get("services"):
-            confidence_factors.append(0.2)
+            confidence += 0.2
 
         # Regional breakdown available
-        regions_data = data.get("regions") or data.get("resource_groups")
-        if regions_data:
-            confidence_factors.append(0.15)
+        if data.get("regions") or data.get("resource_groups"):
+            confidence += 0.15
 
         # Historical data (simulated)
-        confidence_factors.append(0.15)  # Assume we have some historical context
+        confidence += 0.15  # Assume we have some historical context
 
-        return min(sum(confidence_factors), 1.0)
+        return min(confidence, 1.0)
@@ -2,22 +2,31 @@
 Configuration management utilities
 """
 
+import copy
+import functools
 import json
 from pathlib import Path
 from typing import Any, Dict, List, Tuple, Union
 
 import yaml
 
+# libyaml C bindings when PyYAML was built with them, pure-Python safe classes otherwise
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 def load_config(config_path: Union[str, Path]) -> Dict[str, Any]:
     """
     Load configuration from YAML or JSON file
 
+    Parsed files are cached per (path, mtime, size), so repeated loads of an
+    unchanged file skip parsing; editing the file invalidates the entry.
+
     Args:
         config_path: Path to configuration file
 
     Returns:
-        Dictionary containing configuration data
+        Dictionary containing configuration data (a private copy the caller may modify)
 
     Raises:
         FileNotFoundError: If config file doesn't exist
@@ -25,12 +34,26 @@ def load_config(config_path: Union[str, Path]) -> Dict[str, Any]:
     """
     config_path = Path(config_path)
 
-    if not config_path.exists():
-        raise FileNotFoundError(f"Configuration file not found: {config_path}")
+    try:
+        stat = config_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            f"Configuration file not found: {config_path}"
+        ) from None
+
+    return copy.deepcopy(
+        _load_config_cached(str(config_path.resolve()), stat.st_mtime_ns, stat.st_size)
+    )
+
 
+@functools.lru_cache(maxsize=32)
+def _load_config_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    # mtime_ns/size are only part of the cache key
+    config_path = Path(path)
     with open(config_path) as f:
         if config_path.suffix.lower() in [".yaml", ".yml"]:
-            return yaml.safe_load(f) or {}
+            # YAML_LOADER is always CSafeLoader or SafeLoader
+            return yaml.load(f, Loader=YAML_LOADER) or {}  # nosec B506
         elif config_path.suffix.lower() == ".json":
             return json.load(f)
         else:
@@ -52,7 +75,7 @@ def save_config(config: Dict[str, Any], config_path: Union[str, Path]) -> None:
 
     with open(config_path, "w") as f:
         if config_path.suffix.lower() in [".yaml", ".yml"]:
-            yaml.dump(config, f, default_flow_style=False, indent=2)
+            yaml.dump(config, f, Dumper=YAML_DUMPER, default_flow_style=False, indent=2)
         elif config_path.suffix.lower() == ".json":
             json.dump(config, f, indent=2)
         else:
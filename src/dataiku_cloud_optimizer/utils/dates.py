@@ -0,0 +1,25 @@
+"""
+Date parsing utilities
+"""
+
+from datetime import date, datetime
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1024)
+def parse_day(value: str) -> date:
+    """
+    Parse a YYYY-MM-DD date, accepting exactly what strptime("%Y-%m-%d") accepts
+
+    Zero-padded dates take the fast date.fromisoformat path; anything else
+    (e.g. "2024-1-5") falls back to strptime, so accepted input is unchanged.
+
+    Raises:
+        ValueError: If the string is not a valid %Y-%m-%d date
+    """
+    if len(value) == 10 and value[4] == "-" and value[7] == "-":
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            pass
+    return datetime.strptime(value, "%Y-%m-%d").date()
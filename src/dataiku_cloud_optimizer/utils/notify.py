@@ -7,18 +7,57 @@ import smtplib
 from dataclasses import dataclass
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-from typing import Any, Optional  # noqa: I001
+from typing import Any, Dict, List, Optional  # noqa: I001
 
 from slack_sdk import WebClient
 
+# Slack caps section text at 3000 characters and a section at 10 fields
+_SLACK_TEXT_LIMIT = 3000
+_SLACK_MAX_FIELDS = 10
+
 
 class Notifier:
-    """Basic interface for notifiers."""
+    """Basic interface for notifiers.
+
+    ``send`` may receive ``highlights``: a list of
+    ``{"provider", "resource_type", "savings", "confidence"}`` dicts describing the
+    top results. Notifiers that can render structured content use it; others
+    ignore it along with any other unknown keyword arguments.
+    """
 
     def send(self, message: str, **kwargs: Any) -> None:  # pragma: no cover - interface
         raise NotImplementedError
 
 
+def slack_blocks(
+    message: str, highlights: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """Block Kit layout: the summary text plus one field per highlighted result"""
+    blocks: List[Dict[str, Any]] = [
+        {
+            "type": "section",
+            "text": {"type": "mrkdwn", "text": message[:_SLACK_TEXT_LIMIT]},
+        }
+    ]
+    if highlights:
+        blocks.append(
+            {
+                "type": "section",
+                "fields": [
+                    {
+                        "type": "mrkdwn",
+                        "text": (
+                            f"*{h['provider'].upper()}* {h['resource_type']}\n"
+                            f"${h['savings']:,.2f} ({h['confidence']:.0%} confidence)"
+                        ),
+                    }
+                    for h in highlights[:_SLACK_MAX_FIELDS]
+                ],
+            }
+        )
+    return blocks
+
+
 @dataclass
 class SlackNotifier(Notifier):
     token: Optional[str] = None
@@ -32,7 +71,16 @@ class SlackNotifier(Notifier):
     def send(self, message: str, **kwargs: Any) -> None:
         if not self._client or not self.channel:
             raise RuntimeError("Slack client not configured or missing channel")
-        self._client.chat_postMessage(channel=self.channel, text=message)
+        highlights = kwargs.get("highlights")
+        if highlights:
+            # text stays as the fallback for push notifications and old clients
+            self._client.chat_postMessage(
+                channel=self.channel,
+                text=message,
+                blocks=slack_blocks(message, highlights),
+            )
+        else:
+            self._client.chat_postMessage(channel=self.channel, text=message)
 
 
 @dataclass
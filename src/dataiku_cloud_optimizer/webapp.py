@@ -48,19 +48,7 @@ def create_app(agent: Optional[CloudOptimizerAgent] = None) -> FastAPI:
     @app.get("/recommendations")
     def get_recommendations(provider: Optional[str] = None) -> List[Dict[str, Any]]:
         results = _agent.get_recommendations(provider)
-        return [
-            {
-                "provider": r.provider,
-                "resource_type": r.resource_type,
-                "current_cost": r.current_cost,
-                "optimized_cost": r.optimized_cost,
-                "savings": r.savings,
-                "recommendations": r.recommendations,
-                "confidence_score": r.confidence_score,
-                "timestamp": r.timestamp.isoformat(),
-            }
-            for r in results
-        ]
+        return [r.to_dict() for r in results]
 
     @app.post("/proactive/run")
     def proactive_run(body: ProactiveRunRequest) -> Dict[str, Any]:
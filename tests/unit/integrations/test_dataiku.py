@@ -34,6 +34,15 @@ class TestDataikuIntegration:
         assert result is True
         assert integration._authenticated is True
 
+    def test_authenticate_is_idempotent(self, sample_dataiku_config):
+        """Test that a second authenticate call skips the auth flow"""
+        integration = DataikuIntegration(sample_dataiku_config)
+        assert integration.authenticate() is True
+
+        integration.url = ""
+
+        assert integration.authenticate() is True
+
     def test_authenticate_missing_credentials(self):
         """Test authentication with missing credentials"""
         integration = DataikuIntegration()
@@ -77,6 +86,18 @@ class TestDataikuIntegration:
         assert "avg_cpu_utilization" in cluster
         assert "total_cost" in cluster
 
+    def test_get_workload_data_copy(self, sample_dataiku_config):
+        """Test that stub data is shared unless a private copy is requested"""
+        integration = DataikuIntegration(sample_dataiku_config)
+
+        shared = integration.get_workload_data()
+        private = integration.get_workload_data(copy=True)
+
+        assert integration.get_workload_data() is shared
+        assert private == shared
+        assert private is not shared
+        assert private[0]["resource_usage"] is not shared[0]["resource_usage"]
+
     def test_apply_recommendations(self, sample_dataiku_config):
         """Test applying recommendations"""
         integration = DataikuIntegration(sample_dataiku_config)
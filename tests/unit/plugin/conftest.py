@@ -0,0 +1,38 @@
+"""
+Fixtures for the DSS plugin's embedded library
+"""
+
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+
+PLUGIN_LIB = (
+    Path(__file__).resolve().parents[3] / "dss_cloud_optimizer_plugin" / "python-lib"
+)
+PACKAGE = "dataiku_cloud_optimizer"
+
+
+def _package_modules():
+    return {
+        name: module
+        for name, module in sys.modules.items()
+        if name == PACKAGE or name.startswith(PACKAGE + ".")
+    }
+
+
+@pytest.fixture
+def plugin():
+    """The plugin's python-lib package, imported in place of the same-named CLI package"""
+    saved = _package_modules()
+    for name in saved:
+        del sys.modules[name]
+    sys.path.insert(0, str(PLUGIN_LIB))
+    try:
+        yield importlib.import_module(PACKAGE)
+    finally:
+        sys.path.remove(str(PLUGIN_LIB))
+        for name in _package_modules():
+            del sys.modules[name]
+        sys.modules.update(saved)
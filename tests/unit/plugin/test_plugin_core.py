@@ -0,0 +1,124 @@
+"""
+Unit tests for the DSS plugin's embedded CloudOptimizerAgent
+"""
+
+import copy
+import pickle
+from datetime import datetime
+from types import SimpleNamespace
+
+
+class TestPluginOptimizationResult:
+    """Test cases for the plugin's OptimizationResult"""
+
+    def test_copy_and_pickle(self, plugin):
+        """Test that the frozen slotted result survives copy, deepcopy and pickle"""
+        result = plugin.OptimizationResult(
+            provider="aws",
+            resource_type="multi-service",
+            current_cost=1000.0,
+            optimized_cost=850.0,
+            savings=150.0,
+            recommendations=["Rightsize overprovisioned instances"],
+            confidence_score=1.0,
+            timestamp=datetime(2024, 12, 1),
+        )
+
+        assert copy.copy(result) == result
+        clone = copy.deepcopy(result)
+        assert clone == result
+        assert clone.recommendations is not result.recommendations
+        assert pickle.loads(pickle.dumps(result)) == result
+        assert not hasattr(result, "__dict__")
+
+
+def _small_provider(plugin, calls, **config):
+    """AWS stub whose cost is below every rule's floor; counts billing calls"""
+
+    class SmallProvider(plugin.AWSProvider):
+        @plugin.providers.base.ttl_cache()
+        def get_cost_data(self, start_date=None, end_date=None, **kwargs):
+            calls.append((start_date, end_date))
+            return {
+                "provider": "aws",
+                "total_cost": 50.0,
+                "resource_count": 3,
+                "services": {"EC2": 50.0},
+            }
+
+    return SmallProvider(config)
+
+
+class TestPluginSmallProviderSkip:
+    """Test cases for reusing results of providers too small to optimize"""
+
+    def _agent(self, plugin, provider):
+        agent = plugin.CloudOptimizerAgent()
+        agent.register_provider("aws", provider)
+        agent.register_strategy("cost", plugin.CostOptimizationStrategy())
+        return agent
+
+    def test_reuses_last_result_while_cost_is_cached(self, plugin):
+        """Test that a cached too-small total skips the billing call"""
+        calls = []
+        agent = self._agent(plugin, _small_provider(plugin, calls))
+
+        first = agent.optimize("aws", "cost", now=datetime(2024, 12, 1))
+        second = agent.optimize("aws", "cost", now=datetime(2024, 12, 2))
+
+        assert len(calls) == 1
+        assert second.timestamp == datetime(2024, 12, 2)
+        # Every other field is the strategy's own answer, not a placeholder
+        assert second.resource_type == first.resource_type == "multi-service"
+        assert second.confidence_score == first.confidence_score == 1.0
+        assert second.current_cost == 50.0
+        assert second.recommendations == []
+
+    def test_cache_ttl_zero_disables_skipping(self, plugin):
+        """Test that cache_ttl_seconds=0 neither remembers nor serves a total"""
+        calls = []
+        provider = _small_provider(plugin, calls, cache_ttl_seconds=0)
+        agent = self._agent(plugin, provider)
+
+        agent.optimize("aws", "cost")
+        agent.optimize("aws", "cost")
+
+        assert len(calls) == 2
+        assert provider.peek_total_cost() is None
+
+    def test_remembered_total_expires_with_the_cache(self, plugin, monkeypatch):
+        """Test that the remembered total is only served for the cache TTL"""
+        base = plugin.providers.base
+        provider = _small_provider(plugin, [], cache_ttl_seconds=60)
+        monkeypatch.setattr(base, "time", SimpleNamespace(monotonic=lambda: 1000.0))
+        provider.get_cost_data()
+
+        monkeypatch.setattr(base, "time", SimpleNamespace(monotonic=lambda: 1030.0))
+        assert provider.peek_total_cost() == 50.0
+        monkeypatch.setattr(base, "time", SimpleNamespace(monotonic=lambda: 1061.0))
+        assert provider.peek_total_cost() is None
+
+
+class TestPluginNotify:
+    """Test cases for the plugin agent's notifier fan-out"""
+
+    def test_failing_notifier_is_logged(self, plugin, caplog):
+        """Test that a notifier exception is logged and reported as failed"""
+
+        class Broken:
+            def send(self, message, **kwargs):
+                raise RuntimeError("webhook down")
+
+        class Working:
+            def send(self, message, **kwargs):
+                return True
+
+        agent = plugin.CloudOptimizerAgent()
+        agent.register_notifier("slack", Broken())
+        agent.register_notifier("email", Working())
+
+        status = agent.notify("cycle done")
+
+        assert status == {"slack": False, "email": True}
+        assert "Notifier 'slack' failed" in caplog.text
+        assert "webhook down" in caplog.text
@@ -0,0 +1,31 @@
+"""
+Unit tests for the DSS plugin's SimpleLLM wrapper
+"""
+
+
+class TestPluginSimpleLLM:
+    """Test cases for SimpleLLM context handling"""
+
+    def test_summarize_uses_json_string_context_verbatim(self, plugin, monkeypatch):
+        """Test that a pre-encoded compact context is sent and cached as-is"""
+        llm = plugin.SimpleLLM(api_key=None)
+        prompts = []
+        monkeypatch.setattr(
+            llm, "_complete", lambda prompt, **kwargs: prompts.append(prompt) or "ok"
+        )
+        context = (
+            '{"results":[{"provider":"aws","savings":150.0}],"strategies":["cost"]}'
+        )
+
+        assert llm.summarize("Found 1 recommendations", context) == "ok"
+
+        assert prompts == [
+            "Context:\n" + context + "\nBase Summary:\nFound 1 recommendations"
+        ]
+        # The same context as a dict encodes to the same string, so it is a cache hit
+        as_dict = {
+            "results": [{"provider": "aws", "savings": 150.0}],
+            "strategies": ["cost"],
+        }
+        assert llm.summarize("Found 1 recommendations", as_dict) == "ok"
+        assert len(prompts) == 1
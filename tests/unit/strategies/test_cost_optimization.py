@@ -113,6 +113,26 @@ class TestCostOptimizationStrategy:
         preemptible_rec = any("Preemptible" in rec for rec in recommendations)
         assert preemptible_rec
 
+    def test_subclass_override_of_provider_recommendations(self):
+        """Test that overriding a built-in provider method is honoured"""
+
+        class CustomStrategy(CostOptimizationStrategy):
+            def _get_aws_specific_recommendations(self, cost_data):
+                return [
+                    {
+                        "type": "graviton",
+                        "description": "Move to Graviton instances",
+                        "savings": 100.0,
+                        "confidence": 0.7,
+                        "priority": "medium",
+                    }
+                ]
+
+        result = CustomStrategy().optimize({"provider": "aws", "total_cost": 1000.0})
+
+        assert "Move to Graviton instances" in result["recommendations"]
+        assert not any("Spot Instances" in rec for rec in result["recommendations"])
+
     def test_recommendations_filtering(self):
         """Test filtering of recommendations by minimum savings"""
         config = {"min_savings_threshold": 100.0}  # High threshold
@@ -0,0 +1,73 @@
+"""
+Unit tests for the CLI
+"""
+
+import json
+
+import click
+from click.testing import CliRunner
+
+from dataiku_cloud_optimizer.cli import _get_agent, cli
+
+
+class TestCli:
+    """Test cases for the command line interface"""
+
+    def test_get_agent_registers_only_requested_provider(self):
+        """Test that a provider-scoped command builds an agent with that provider only"""
+        ctx = click.Context(cli, obj={"config": {}, "agent": None})
+
+        agent = _get_agent(ctx, ["aws"])
+
+        assert list(agent.providers) == ["aws"]
+        assert _get_agent(ctx) is agent
+
+    def test_get_agent_defaults_to_all_providers(self):
+        """Test that no provider filter registers every provider"""
+        ctx = click.Context(cli, obj={"config": {}, "agent": None})
+
+        agent = _get_agent(ctx)
+
+        assert list(agent.providers) == ["aws", "azure", "gcp"]
+
+    def test_analyze_json_output(self):
+        """Test the analyze command end to end"""
+        result = CliRunner().invoke(
+            cli, ["analyze", "--provider", "gcp", "--output", "json"]
+        )
+
+        assert result.exit_code == 0
+        assert json.loads(result.output)["provider"] == "gcp"
+
+    def test_optimize_json_output(self):
+        """Test that optimize emits the result as JSON"""
+        result = CliRunner().invoke(
+            cli, ["optimize", "--provider", "aws", "--output", "json"]
+        )
+
+        assert result.exit_code == 0
+        payload = json.loads(result.output)
+        assert payload["provider"] == "aws"
+        assert payload["savings"] > 0
+
+    def test_recommendations_json_output(self):
+        """Test that recommendations emits a JSON list of results"""
+        result = CliRunner().invoke(
+            cli, ["recommendations", "--provider", "azure", "--output", "json"]
+        )
+
+        assert result.exit_code == 0
+        payload = json.loads(result.output)
+        assert isinstance(payload, list)
+        assert [r["provider"] for r in payload] == ["azure"]
+
+    def test_recommendations_stream_json_output(self):
+        """Test that --stream writes a valid JSON array, one result per line"""
+        result = CliRunner().invoke(
+            cli, ["recommendations", "--output", "json", "--stream"]
+        )
+
+        assert result.exit_code == 0
+        payload = json.loads(result.output)
+        assert [r["provider"] for r in payload] == ["aws", "azure", "gcp"]
+        assert len(result.output.strip().splitlines()) == len(payload) + 2
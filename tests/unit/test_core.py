@@ -2,6 +2,12 @@
 Unit tests for the core CloudOptimizerAgent
 """
 
+import copy
+import pickle
+import time
+from dataclasses import FrozenInstanceError, replace
+from datetime import datetime
+
 import pytest
 
 from dataiku_cloud_optimizer.core import CloudOptimizerAgent, OptimizationResult
@@ -58,6 +64,17 @@ class TestCloudOptimizerAgent:
         assert len(agent.strategies) == 0
         assert len(agent.integrations) == 0
 
+    def test_proactive_api_present(self):
+        """Test the agent exposes the full proactive API (guards against a shadowing redefinition)"""
+        for name in (
+            "register_llm",
+            "register_notifier",
+            "summarize_results",
+            "notify",
+            "run_proactive_cycle",
+        ):
+            assert hasattr(CloudOptimizerAgent, name)
+
     def test_register_provider(self):
         """Test provider registration"""
         agent = CloudOptimizerAgent()
@@ -97,6 +114,42 @@ class TestCloudOptimizerAgent:
         with pytest.raises(ValueError, match="Provider unknown not registered"):
             agent.analyze_costs("unknown")
 
+    def test_analyze_costs_cached_within_ttl(self):
+        """Test repeated cost lookups hit the provider once within the TTL"""
+
+        class CountingProvider(MockProvider):
+            calls = 0
+
+            def get_cost_data(self, **kwargs):
+                CountingProvider.calls += 1
+                return super().get_cost_data(**kwargs)
+
+        agent = CloudOptimizerAgent()
+        agent.register_provider("test", CountingProvider())
+        agent.register_strategy("test", MockStrategy())
+
+        first = agent.analyze_costs("test", start_date="2024-01-01")
+        agent.optimize("test", "test", start_date="2024-01-01")
+        assert agent.analyze_costs("test", start_date="2024-01-01") == first
+        assert CountingProvider.calls == 1
+
+        # Results are private copies: mutating one does not change the cache
+        first["total_cost"] = 0
+        again = agent.analyze_costs("test", start_date="2024-01-01")
+        assert again["total_cost"] != 0
+        again["total_cost"] = 0
+        assert agent.analyze_costs("test", start_date="2024-01-01")["total_cost"] != 0
+        assert CountingProvider.calls == 1
+
+        agent.analyze_costs("test", start_date="2024-02-01")
+        assert CountingProvider.calls == 2
+
+        uncached = CloudOptimizerAgent(cost_cache_ttl=0)
+        uncached.register_provider("test", CountingProvider())
+        uncached.analyze_costs("test")
+        uncached.analyze_costs("test")
+        assert CountingProvider.calls == 4
+
     def test_optimize_success(self):
         """Test successful optimization"""
         agent = CloudOptimizerAgent()
@@ -117,6 +170,65 @@ class TestCloudOptimizerAgent:
         assert len(result.recommendations) == 1
         assert result.confidence_score == 0.8
 
+    def test_optimization_result_to_dict(self):
+        """Test JSON-ready conversion of an optimization result"""
+        agent = CloudOptimizerAgent()
+        agent.register_provider("test", MockProvider())
+        agent.register_strategy("test", MockStrategy())
+
+        result = agent.optimize("test", "test")
+        data = result.to_dict()
+
+        assert data["provider"] == "test"
+        assert data["savings"] == 100.0
+        assert data["recommendations"] == result.recommendations
+        assert data["recommendations"] is not result.recommendations
+        assert data["timestamp"] == result.timestamp.isoformat()
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(FrozenInstanceError):
+            result.savings = 0.0
+
+    def test_optimization_result_copy_and_pickle(self):
+        """Test that the frozen slotted result survives copy, deepcopy and pickle"""
+        agent = CloudOptimizerAgent()
+        agent.register_provider("test", MockProvider())
+        agent.register_strategy("test", MockStrategy())
+
+        result = agent.optimize("test", "test")
+
+        assert copy.copy(result) == result
+        clone = copy.deepcopy(result)
+        assert clone == result
+        assert clone.recommendations is not result.recommendations
+        assert pickle.loads(pickle.dumps(result)) == result
+
+    def test_optimization_result_accepts_non_string_resource_type(self):
+        """Test that only string names are interned"""
+        result = OptimizationResult(
+            provider="aws",
+            resource_type=None,
+            current_cost=100.0,
+            optimized_cost=80.0,
+            savings=20.0,
+            recommendations=[],
+            confidence_score=0.5,
+            timestamp=datetime.now(),
+        )
+
+        assert result.provider == "aws"
+        assert result.resource_type is None
+
+    def test_savings_percent_handles_zero_cost(self):
+        """Test savings percentage, including the zero current cost case"""
+        agent = CloudOptimizerAgent()
+        agent.register_provider("test", MockProvider())
+        agent.register_strategy("test", MockStrategy())
+
+        result = agent.optimize("test", "test")
+        assert result.savings_percent == pytest.approx(20.0)
+
+        assert replace(result, current_cost=0.0).savings_percent == 0.0
+
     def test_optimize_unknown_provider(self):
         """Test optimization with unknown provider"""
         agent = CloudOptimizerAgent()
@@ -168,6 +280,23 @@ class TestCloudOptimizerAgent:
         assert "test1" in provider_names
         assert "test2" in provider_names
 
+    def test_get_recommendations_keeps_provider_order(self):
+        """Test concurrent recommendations come back in registration order"""
+
+        class SlowProvider(MockProvider):
+            def get_cost_data(self, **kwargs):
+                time.sleep(0.05)
+                return super().get_cost_data(**kwargs)
+
+        agent = CloudOptimizerAgent()
+        agent.register_provider("slow", SlowProvider())
+        agent.register_provider("fast", MockProvider())
+        agent.register_strategy("test", MockStrategy())
+
+        results = agent.get_recommendations()
+
+        assert [r.provider for r in results] == ["slow", "fast"]
+
     def test_get_recommendations_no_strategies(self):
         """Test getting recommendations when no strategies are registered"""
         agent = CloudOptimizerAgent()
@@ -177,3 +306,81 @@ class TestCloudOptimizerAgent:
         results = agent.get_recommendations("test")
 
         assert len(results) == 0
+
+    def test_summarize_results_sends_top_savings_to_llm(self):
+        """Test that only the top-N results by savings reach the LLM context"""
+        agent = CloudOptimizerAgent(max_context_results=2)
+        captured = {}
+
+        class StubLLM:
+            def summarize(self, text, context):
+                captured["text"] = text
+                captured["context"] = context
+                return "summary"
+
+        agent.register_llm(StubLLM())
+        results = [
+            OptimizationResult(
+                provider=f"p{i}",
+                resource_type="compute",
+                current_cost=100.0,
+                optimized_cost=100.0 - i,
+                savings=float(i),
+                recommendations=[],
+                confidence_score=0.5,
+                timestamp=datetime.now(),
+            )
+            for i in range(6)
+        ]
+
+        assert agent.summarize_results(results) == "summary"
+        assert [r["provider"] for r in captured["context"]["results"]] == ["p5", "p4"]
+        assert "Found 6 opportunities" in captured["text"]
+        assert "P0" not in captured["text"]
+
+    def test_notify_reports_each_channel_in_order(self):
+        """Test notify results for working, failing and unknown channels"""
+        agent = CloudOptimizerAgent()
+
+        class OkNotifier:
+            def send(self, message, **kwargs):
+                time.sleep(0.05)
+                return True
+
+        class FailingNotifier:
+            def send(self, message, **kwargs):
+                raise RuntimeError("boom")
+
+        agent.register_notifier("slack", OkNotifier())
+        agent.register_notifier("email", FailingNotifier())
+
+        status = agent.notify("hello", ["slack", "missing", "email"])
+
+        assert list(status) == ["slack", "missing", "email"]
+        assert status == {"slack": True, "missing": False, "email": False}
+
+    def test_run_proactive_cycle_passes_highlights(self):
+        """Test that notifiers receive structured highlights next to the summary"""
+        agent = CloudOptimizerAgent()
+        agent.register_provider("test", MockProvider())
+        agent.register_strategy("test", MockStrategy())
+        received = {}
+
+        class RecordingNotifier:
+            def send(self, message, **kwargs):
+                received.update(kwargs, message=message)
+
+        agent.register_notifier("rec", RecordingNotifier())
+
+        outcome = agent.run_proactive_cycle()
+
+        assert outcome["notify"] == {"rec": True}
+        assert received["message"] == outcome["summary"]
+        assert received["highlights"] == [
+            {
+                "provider": "test",
+                "resource_type": "test",
+                "savings": 100.0,
+                "confidence": 0.8,
+            }
+        ]
@@ -1,6 +1,7 @@
 """Unit tests for configuration utilities"""
 
 import json
+import os
 import tempfile
 from pathlib import Path
 
@@ -64,6 +65,26 @@ class TestConfigUtils:
         finally:
             Path(config_path).unlink()
 
+    def test_load_config_reloads_after_change(self):
+        """Test cached loads pick up edits and do not share mutable state"""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+            yaml.dump({"providers": {"aws": {"region": "us-east-1"}}}, f)
+            config_path = f.name
+
+        try:
+            first = load_config(config_path)
+            first["providers"]["aws"]["region"] = "mutated"
+            assert load_config(config_path)["providers"]["aws"]["region"] == "us-east-1"
+
+            with open(config_path, "w") as f:
+                yaml.dump({"providers": {"aws": {"region": "eu-west-1"}}}, f)
+            stat = os.stat(config_path)
+            os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+            assert load_config(config_path)["providers"]["aws"]["region"] == "eu-west-1"
+        finally:
+            Path(config_path).unlink()
+
     def test_save_config_yaml(self):
         """Test saving YAML configuration"""
         config_data = {"providers": {"aws": {"region": "us-east-1"}}}
@@ -0,0 +1,27 @@
+"""Unit tests for date parsing utilities"""
+
+from datetime import date
+
+import pytest
+
+from dataiku_cloud_optimizer.utils.dates import parse_day
+
+
+class TestDateUtils:
+    """Test cases for date parsing utilities"""
+
+    def test_parse_day(self):
+        """Test parsing a YYYY-MM-DD date"""
+        assert parse_day("2024-01-31") == date(2024, 1, 31)
+
+    def test_parse_day_accepts_unpadded_fields(self):
+        """Test that unpadded month/day parse as they did with strptime"""
+        assert parse_day("2024-1-5") == date(2024, 1, 5)
+
+    @pytest.mark.parametrize(
+        "value", ["2024/01/31", "20240131", "2024-W05-3", "2024-02-30"]
+    )
+    def test_parse_day_rejects_other_formats(self, value):
+        """Test that non YYYY-MM-DD or invalid dates raise ValueError"""
+        with pytest.raises(ValueError):
+            parse_day(value)